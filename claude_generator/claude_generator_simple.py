@@ -30,6 +30,12 @@ except ImportError as e:
 # Konfigurace
 load_dotenv()
 
+# Vzory validačního bloku (předkompilované, zkoušejí se v tomto pořadí)
+VALIDATION_PATTERNS = (
+    re.compile(r'---VALIDATION---\n(.*?)$', re.DOTALL),
+    re.compile(r'---\n(.*?)$', re.DOTALL),
+)
+
 class GenerationStatus(Enum):
     """Stavy generování"""
     SUCCESS = "success"
@@ -271,14 +277,9 @@ class ClaudeGenerator:
     def parse_validation(self, text: str) -> Optional[Dict]:
         """Parsuje YAML validaci z výstupu"""
         try:
-            patterns = [
-                (r'---VALIDATION---\n(.*?)$', re.DOTALL),
-                (r'---\n(.*?)$', re.DOTALL),
-            ]
-
             yaml_text = None
-            for pattern, flags in patterns:
-                match = re.search(pattern, text, flags)
+            for pattern in VALIDATION_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     yaml_text = match.group(1).strip()
                     break
@@ -303,8 +304,7 @@ class ClaudeGenerator:
 
     def count_words(self, text: str) -> int:
         """Spočítá slova v textu"""
-        cleaned = ' '.join(text.split())
-        return len(cleaned.split()) if cleaned else 0
+        return len(text.split())
 
     def check_requirements(self, text: str, validation: Dict, target_words: int,
                          tolerance_percent: int) -> Tuple[bool, List[str]]:
@@ -39,6 +39,7 @@ params = {
     'max_tokens': cfg.max_tokens
 }
 params_json = json.dumps(params, sort_keys=True)
+params_bytes = params_json.encode('utf-8')
 
 prompts_root = Path(cfg.base_output_path)
 if not prompts_root.exists():
@@ -69,7 +70,10 @@ for pf in prompt_files:
         text = pf.read_text(encoding='utf-8')
     except Exception:
         text = pf.read_text(encoding='utf-8', errors='replace')
-    key = hashlib.sha256((text + params_json).encode('utf-8')).hexdigest()
+    # same digest as hashing (text + params_json), without building the concatenation
+    h = hashlib.sha256(text.encode('utf-8'))
+    h.update(params_bytes)
+    key = h.hexdigest()
     gz = cache_dir / f"{key}.gz"
     if gz.exists():
         try:
@@ -8,6 +8,11 @@ from pathlib import Path
 from typing import Dict, List, Optional, Callable
 import threading
 
+try:  # optional, noticeably faster for large index files
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
 TEXT_EXT = {'.txt', '.md', '.json'}
 
 
@@ -106,6 +111,19 @@ def list_prompt_files(ep_dir: Path) -> List[Dict]:
     return sorted(out, key=lambda x: x['name'])
 
 
+def is_execution_prompt(name: str) -> bool:
+    """True for msp_*execution*.txt prompt files (one per narration segment)."""
+    n = name.lower()
+    return n.startswith('msp_') and n.endswith('.txt') and 'execution' in n
+
+
+def episode_status(generated: int, expected: int) -> str:
+    """OK / PENDING / PARTIAL label for an episode with ``generated`` of ``expected`` segments."""
+    if expected and generated == expected:
+        return 'OK'
+    return 'PENDING' if generated == 0 else 'PARTIAL'
+
+
 def _read_expected_segment_count(ep_path: Path) -> int:
     meta = ep_path / 'meta' / 'episode_context.json'
     try:
@@ -152,6 +170,7 @@ def scan_prompts_root(root: Optional[str] = None, allowed_langs: Optional[List[s
                 prompts = list_prompt_files(epath)
                 index['topics'][topic]['languages'][lang]['episodes'][ep] = {
                     'prompts': prompts,
+                    'execution_count': sum(1 for p in prompts if is_execution_prompt(p['name'])),
                     'expected_segments': _read_expected_segment_count(epath)
                 }
         tcount += 1
@@ -213,7 +232,10 @@ def scan_narration_root(root: Optional[str] = None, stop_event: Optional[threadi
                                 'mtime': st.st_mtime,
                                 'size': st.st_size,
                             })
-                index['topics'][topic]['languages'][lang]['episodes'][ep] = {'segments': sorted(segs, key=lambda x: x['name'])}
+                index['topics'][topic]['languages'][lang]['episodes'][ep] = {
+                    'segments': sorted(segs, key=lambda x: x['name']),
+                    'segment_count': len(segs),
+                }
         tcount += 1
         if progress_callback:
             pct = 50 + int((tcount / total_topics) * 50)
@@ -272,8 +294,13 @@ def scan_final_root(root: Optional[str] = None, stop_event: Optional[threading.E
 
 
 def save_index(path: str, index: Dict):
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-    Path(path).write_text(json.dumps(index, ensure_ascii=False, indent=2), encoding='utf-8')
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        # semantically equivalent to the json fallback below (float/escape formatting may differ)
+        p.write_bytes(orjson.dumps(index, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    p.write_text(json.dumps(index, ensure_ascii=False, indent=2), encoding='utf-8')
 
 
 def load_index(path: str) -> Optional[Dict]:
@@ -281,6 +308,8 @@ def load_index(path: str) -> Optional[Dict]:
     if not p.exists():
         return None
     try:
+        if orjson is not None:
+            return orjson.loads(p.read_bytes())
         return json.loads(p.read_text(encoding='utf-8'))
     except Exception:
         return None
@@ -4,12 +4,16 @@ import os
 import sys
 import json
 import asyncio
+import functools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import hashlib
 from pathlib import Path
 from datetime import datetime, timezone
 
-from PySide6.QtCore import QThread, Signal, QObject, QSettings, QCoreApplication, Qt, QTimer
+from PySide6.QtCore import Signal, Slot, QObject, QSettings, QCoreApplication, Qt, QTimer, QThread, QMetaObject, QSignalBlocker, QRunnable, QThreadPool, QAbstractListModel, QModelIndex
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -28,16 +32,21 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QDoubleSpinBox,
     QGroupBox,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
+    QAbstractItemView,
     QMessageBox,
     QProgressBar,
 )
 
 from .process_runner import ProcessRunner
 from .qprocess_runner import SubprocessController
+from .fs_index import (
+    discover_final_root, discover_narration_root, discover_prompts_root, episode_status, is_execution_prompt,
+    load_index, save_index, scan_final_root, scan_narration_root, scan_prompts_root,
+)
 from .utils.path_resolver import PathResolver
-from .utils.fs_helpers import normalize_name, resolve_topic_dir, find_topic_in_index
+from .utils.fs_helpers import find_topic_in_index, normalize_name, resolve_topic_dir, topic_key_map
+from .utils.dir_cache import list_subdirs, clear_dir_cache
 from .widgets.log_pane import LogPane
 
 import logging
@@ -55,53 +64,415 @@ def _configure_logging(level: int = logging.INFO) -> None:
     structlog.configure(logger_factory=structlog.stdlib.LoggerFactory(), cache_logger_on_first_use=True)
     logging.getLogger().setLevel(level)
 
-def _start_qprocess(cmd: list[str], env: dict | None, parent: QObject, log_cb, finished_cb, cwd: str | None = None):
-    """Helper to start a SubprocessController in a QThread and connect callbacks.
+# Supported output languages, in UI order
+_LANG_CODES = ("CS", "EN", "DE", "ES", "FR")
+_LANG_CODES_SET = frozenset(_LANG_CODES)
 
-    finished_cb is expected to accept a single int exit_code (legacy callers).
-    Returns (thread, worker)
+# Outline option choices, in combo order; *_IDX map a stored value to its combo index
+_ORDERINGS = ("chronological", "thematic")
+_SRC_FORMATS = ("name-only", "with-url", "full-citation")
+_ORDERING_IDX = {v: i for i, v in enumerate(_ORDERINGS)}
+_SRC_FMT_IDX = {v: i for i, v in enumerate(_SRC_FORMATS)}
+
+# Shared pool for filesystem probes/reads that should run side by side (slow/network mounts)
+_FS_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fs-probe")
+
+
+class SettingsWriter(QObject):
+    """Performs QSettings writes on its own thread.
+
+    Payloads emitted through ``write_requested`` are queued to the writer's
+    thread, so the UI thread never waits on the settings backend.
     """
-    thread = QThread(parent)
-    worker = SubprocessController()
-    # DŮLEŽITÉ: moveToThread PŘED nastavením signálů
-    worker.moveToThread(thread)
 
-    # wire basic log line -> UI callback (use QueuedConnection to ensure thread safety)
-    worker.log_line.connect(log_cb, Qt.QueuedConnection)
+    write_requested = Signal(dict)
 
-    # parsed structured logs -> send as stdout JSON string to log_cb
-    def _on_parsed(obj):
-        try:
-            s = json.dumps(obj, ensure_ascii=False)
-        except Exception:
-            s = str(obj)
-        log_cb("stdout", s)
-    worker.parsed_log.connect(_on_parsed, Qt.QueuedConnection)
+    def __init__(self) -> None:
+        super().__init__()
+        self._qs: Optional[QSettings] = None
+        self.write_requested.connect(self.write)
+
+    def _backend(self) -> QSettings:
+        # Created lazily so the QSettings object belongs to the writer thread
+        if self._qs is None:
+            self._qs = QSettings()
+        return self._qs
+
+    @Slot(dict)
+    def write(self, payload: dict) -> None:
+        qs = self._backend()
+        for key, value in payload.items():
+            qs.setValue(key, value)
+
+    @Slot()
+    def flush(self) -> None:
+        if self._qs is not None:
+            self._qs.sync()
+
+
+class CachedSettings:
+    """Dict-backed read cache in front of a QSettings instance.
+
+    All existing keys are preloaded with a single allKeys() scan; later reads
+    are served from memory and writes update the cache immediately. With a
+    SettingsWriter attached, the backend writes are handed off to the writer
+    thread; otherwise they go straight to the wrapped QSettings.
+    Supports the beginGroup()/endGroup() subset used by the tabs; anything
+    else is forwarded to the wrapped QSettings.
+    """
 
-    # errors from controller
-    worker.error.connect(lambda msg: log_cb("stderr", f"[qprocess_runner] {msg}"), Qt.QueuedConnection)
+    _MISSING = object()
 
-    # finished emits (exit_code, exit_status) -> call legacy finished_cb(exit_code)
-    def _wrapped_finished(exit_code: int, exit_status: int):
+    def __init__(self, qs: QSettings, writer: Optional[SettingsWriter] = None) -> None:
+        self._qs = qs
+        self._writer = writer
+        self._groups: list[str] = []
+        self._cache: dict[str, object] = {k: qs.value(k) for k in qs.allKeys()}
+
+    def _full_key(self, key: str) -> str:
+        return "/".join([*self._groups, key]) if self._groups else key
+
+    def value(self, key: str, defaultValue=None):
+        full = self._full_key(key)
+        v = self._cache.get(full, self._MISSING)
+        if v is self._MISSING:
+            v = self._qs.value(full) if self._qs.contains(full) else None
+            self._cache[full] = v
+        return defaultValue if v is None else v
+
+    def setValue(self, key: str, value) -> None:
+        self.update({key: value})
+
+    def update(self, values: dict) -> None:
+        """Store several values at once (keys are relative to the current group)."""
+        if not values:
+            return
+        payload = {self._full_key(k): v for k, v in values.items()}
+        self._cache.update(payload)
+        if self._writer is not None:
+            self._writer.write_requested.emit(payload)
+        else:
+            for full, v in payload.items():
+                self._qs.setValue(full, v)
+
+    def beginGroup(self, prefix: str) -> None:
+        self._groups.append(prefix.strip("/"))
+
+    def endGroup(self) -> None:
+        if self._groups:
+            self._groups.pop()
+
+    def __getattr__(self, name: str):
+        return getattr(self._qs, name)
+
+
+_SETTINGS: Optional[CachedSettings] = None
+_SETTINGS_THREAD: Optional[QThread] = None
+
+
+def _settings() -> CachedSettings:
+    """Return the app-wide (cached) QSettings instance shared by all tabs.
+
+    Created lazily so it picks up the organization/application names set in
+    main() before the first tab is constructed.
+    """
+    global _SETTINGS, _SETTINGS_THREAD
+    if _SETTINGS is None:
+        writer: Optional[SettingsWriter] = None
+        app = QCoreApplication.instance()
+        if app is not None:
+            _SETTINGS_THREAD = QThread()
+            writer = SettingsWriter()
+            writer.moveToThread(_SETTINGS_THREAD)
+            _SETTINGS_THREAD.start()
+            app.aboutToQuit.connect(_shutdown_settings)
+        _SETTINGS = CachedSettings(QSettings(), writer)
+    return _SETTINGS
+
+
+def _shutdown_settings() -> None:
+    """Drain pending settings writes and stop the writer thread."""
+    global _SETTINGS_THREAD
+    writer = _SETTINGS._writer if _SETTINGS is not None else None
+    if writer is not None and _SETTINGS_THREAD is not None and _SETTINGS_THREAD.isRunning():
+        # Blocking call is queued behind any pending writes, so it returns once they are done
+        QMetaObject.invokeMethod(writer, "flush", Qt.BlockingQueuedConnection)
+        _SETTINGS_THREAD.quit()
+        _SETTINGS_THREAD.wait()
+    _SETTINGS_THREAD = None
+
+
+def _settings_text(value: object) -> str:
+    """``value`` as the INI backend stores it (bools as "true"/"false")."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _changed_values(s: QSettings | CachedSettings, values: list[tuple[str, object]]) -> dict:
+    """Return only the (key, value) pairs that differ from what is stored
+    (compared as text, since INI/registry backends hand values back as strings)."""
+    changed = {}
+    for key, val in values:
+        cur = s.value(key)
+        if cur is None or _settings_text(cur) != _settings_text(val):
+            changed[key] = val
+    return changed
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_topic_dir_cached(root: str, topic_display: str) -> str:
+    """String-keyed memo of utils.resolve_topic_dir (one directory scan per root/topic).
+
+    Cleared by NarrationTab.refresh_topics so newly created folders are picked up.
+    """
+    return str(resolve_topic_dir(Path(root), topic_display))
+
+
+def _scan_dirs(path: str, prefix: str = "") -> list[str]:
+    """Names of subdirectories of ``path`` starting with ``prefix``.
+
+    Served from utils.dir_cache, which rescans only when the folder's mtime
+    changed (checked at most every few seconds). Raises OSError if ``path``
+    cannot be listed.
+    """
+    return [n for n in list_subdirs(path) if n.startswith(prefix)]
+
+
+def _scan_dir_entries(path: str, prefix: str = "") -> dict[str, os.DirEntry]:
+    """Like _scan_dirs, but name -> DirEntry so callers can reuse ``.path``/``.stat()``."""
+    with os.scandir(path) as it:
+        return {e.name: e for e in it if e.name.startswith(prefix) and e.is_dir()}
+
+
+def _scan_files(path: str, suffix: str = "", prefix: str = "") -> list[str]:
+    """Names of regular files in ``path`` matching ``prefix``/``suffix`` (see _scan_dirs)."""
+    with os.scandir(path) as it:
+        return [e.name for e in it if e.name.startswith(prefix) and e.name.endswith(suffix) and e.is_file()]
+
+
+def _outline_langs(topic_dir: str) -> list[str]:
+    """Languages under ``topic_dir`` that have an outline.
+
+    One scandir of the topic dir finds the language folders (matched
+    case-insensitively); each candidate is then listed once to look for
+    osnova.json, in either layout:
+    unified: <root>/<topic>/<code>/osnova.json
+    legacy project-structure: <root>/<topic>/<code>/01_outline/osnova.json
+    """
+    try:
+        with os.scandir(topic_dir) as it:
+            children = {e.name.upper(): e.path for e in it if e.is_dir()}
+    except OSError:
+        return []
+    langs = []
+    for code in _LANG_CODES:
+        path = children.get(code)
+        if path is None:
+            continue
         try:
-            finished_cb(int(exit_code))
-        finally:
-            # stop thread once finished
+            with os.scandir(path) as it:
+                names = {e.name for e in it}
+        except OSError:
+            continue
+        if "osnova.json" in names or (
+            "01_outline" in names and os.path.isfile(os.path.join(path, "01_outline", "osnova.json"))
+        ):
+            langs.append(code)
+    return langs
+
+
+_DEBUG_LOG_PATH = os.path.join('studio_gui', '.tmp', 'narration_debug.log')
+_debug_log_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+_debug_log_thread: Optional[threading.Thread] = None
+
+
+def _debug_log(text: str) -> None:
+    """Append ``text`` to narration_debug.log without blocking the caller."""
+    global _debug_log_thread
+    if _debug_log_thread is None:
+        _debug_log_thread = threading.Thread(target=_debug_log_writer, name="narration-debug-log", daemon=True)
+        _debug_log_thread.start()
+    _debug_log_queue.put(text)
+
+
+def _debug_log_writer() -> None:
+    # Writes whatever has queued up since the last batch in one open/append/close
+    while True:
+        batch = [_debug_log_queue.get()]
+        while True:
             try:
-                thread.quit()
+                batch.append(_debug_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            os.makedirs(os.path.dirname(_DEBUG_LOG_PATH), exist_ok=True)
+            with open(_DEBUG_LOG_PATH, 'a', encoding='utf-8') as f:
+                f.write("".join(batch))
+        except Exception as e:
+            # debug output only; report the lost batch instead of dropping it silently
+            logging.getLogger(__name__).warning(
+                "narration debug log: dropped %d entries (%s)", len(batch), e)
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """st_mtime_ns of ``path``, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_segment_total(meta_path: str) -> int:
+    """Number of segments declared in an episode_context.json (0 if unreadable)."""
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return len(json.load(f).get('segments', []))
+    except Exception:
+        return 0
+
+
+class _RowListModel(QAbstractListModel):
+    """Read-only list model over (display text, Qt.UserRole data) rows.
+
+    Replacing the rows is a single model reset; no per-row item objects are
+    created, and the view only asks for the rows it actually paints.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.rows: list[tuple[str, object]] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        text, data = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.UserRole:
+            return data
+        return None
+
+    def set_rows(self, rows: list[tuple[str, object]]) -> None:
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.set_rows([])
+
+
+def _row_list_view(parent: QWidget) -> QListView:
+    """Single-selection QListView backed by a _RowListModel."""
+    view = QListView(parent)
+    view.setModel(_RowListModel(view))
+    view.setSelectionMode(QAbstractItemView.SingleSelection)
+    view.setUniformItemSizes(True)
+    return view
+
+
+def _selected_row(view: QListView) -> Optional[tuple[str, object]]:
+    """(text, data) of the selected row in a _row_list_view, or None."""
+    indexes = view.selectionModel().selectedIndexes()
+    if not indexes:
+        return None
+    return view.model().rows[indexes[0].row()]
+
+
+def _replace_combo_items(combo: QComboBox, items: list[str]) -> bool:
+    """Replace the combo's items with signals blocked.
+
+    Leaves the combo untouched (and returns False) when it already holds
+    exactly ``items``, so an unchanged refresh costs no model rebuild.
+    """
+    if combo.count() == len(items) and all(combo.itemText(i) == t for i, t in enumerate(items)):
+        return False
+    with QSignalBlocker(combo):
+        combo.clear()
+        combo.addItems(items)
+    return True
+
+
+def invalidate_root_cache() -> None:
+    """Forget cached output roots and directory listings (call after changing the outputs root)."""
+    PathResolver.clear_cache()
+    clear_dir_cache()
+
+
+def _connect_debounced(signal, slot, parent: QObject, interval_ms: int = 50) -> QTimer:
+    """Connect ``signal`` to ``slot`` so a burst of emissions results in a single
+    call with the last emitted arguments, ``interval_ms`` after the burst ends."""
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(interval_ms)
+    pending: list[tuple] = []
+
+    def _on_signal(*args) -> None:
+        pending[:] = [args]
+        timer.start()
+
+    def _on_timeout() -> None:
+        if pending:
+            slot(*pending.pop())
+
+    signal.connect(_on_signal)
+    timer.timeout.connect(_on_timeout)
+    return timer
+
+
+def _start_qprocess(cmd: list[str], env: dict | None, parent: QObject, log_cb, finished_cb,
+                    cwd: str | None = None, lines_cb=None) -> SubprocessController:
+    """Helper to start a SubprocessController on the GUI thread and connect callbacks.
+
+    QProcess already watches the child's pipes from the Qt event loop, so no
+    QThread (and no cross-thread queued signals) is needed per run.
+    Output arrives once per read (log_chunk); with ``lines_cb(stream, lines)``
+    each batch is handed over in one call, otherwise log_cb gets it line by line.
+    finished_cb is expected to accept a single int exit_code (legacy callers).
+    Returns the controller (parented to ``parent``).
+    """
+    worker = SubprocessController(parent)
+
+    # structured (structlog JSON) lines are followed by their parsed form on stdout
+    def _on_chunk(stream: str, lines: list[str]) -> None:
+        out = []
+        for text in lines:
+            out.append((stream, text))
+            if not text.lstrip().startswith('{'):
+                continue
+            try:
+                obj = json.loads(text)
             except Exception:
-                pass
-    worker.finished.connect(_wrapped_finished, Qt.QueuedConnection)
+                continue
+            if isinstance(obj, dict):
+                try:
+                    out.append(("stdout", json.dumps(obj, ensure_ascii=False)))
+                except Exception:
+                    out.append(("stdout", str(obj)))
+        if lines_cb is None:
+            for st, text in out:
+                log_cb(st, text)
+            return
+        # one call per run of same-stream lines
+        start = 0
+        for i in range(1, len(out) + 1):
+            if i == len(out) or out[i][0] != out[start][0]:
+                lines_cb(out[start][0], [text for _st, text in out[start:i]])
+                start = i
+    worker.log_chunk.connect(_on_chunk)
 
-    def _start():
-        prog = cmd[0]
-        args = cmd[1:]
-        # forward cwd to worker.start so subprocess runs in desired working dir
-        worker.start(prog, args, env=env, cwd=cwd)
+    # errors from controller
+    worker.error.connect(lambda msg: log_cb("stderr", f"[qprocess_runner] {msg}"))
+
+    # finished emits (exit_code, exit_status) -> call legacy finished_cb(exit_code)
+    worker.finished.connect(lambda exit_code, _exit_status: finished_cb(int(exit_code)))
 
-    thread.started.connect(_start)
-    thread.start()
-    return thread, worker
+    # forward cwd to worker.start so subprocess runs in desired working dir
+    worker.start(cmd[0], cmd[1:], env=env, cwd=cwd)
+    return worker
 
 
 class AsyncRunner(QObject):
@@ -130,7 +501,7 @@ class ProjectTab(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.outputs_root: Optional[str] = None
-        self.settings = QSettings()
+        self.settings = _settings()
 
         v = QVBoxLayout(self)
         btn_pick = QPushButton("Select outputs/ root…", self)
@@ -190,6 +561,7 @@ class ProjectTab(QWidget):
             self.lbl.setText(f"NC_OUTPUTS_ROOT = {path}")
             os.environ["NC_OUTPUTS_ROOT"] = path
             self.settings.setValue("project/nc_outputs_root", path)
+            invalidate_root_cache()
 
     def rescan_outputs(self) -> None:
         """Trigger rescanning of prompts/narration outputs and persist indexes to studio_gui/.tmp."""
@@ -222,8 +594,9 @@ class ProjectTab(QWidget):
                 pass
 
         def _worker():
+            # freshly built indexes are handed to the tabs as is (no re-read of the saved JSON)
+            pindex = nindex = None
             try:
-                from .fs_index import discover_prompts_root, scan_prompts_root, discover_narration_root, scan_narration_root, discover_final_root, scan_final_root, save_index
                 tmp_dir = os.path.join('studio_gui', '.tmp')
                 os.makedirs(tmp_dir, exist_ok=True)
 
@@ -279,12 +652,13 @@ class ProjectTab(QWidget):
                     tw = win.centralWidget()
                     # try to load cached indexes
                     tmp_dir = os.path.join('studio_gui', '.tmp')
-                    prompts_idx = None
-                    narration_idx = None
+                    prompts_idx = pindex
+                    narration_idx = nindex
                     try:
-                        from .fs_index import load_index
-                        prompts_idx = load_index(os.path.join(tmp_dir, 'prompts_index.json'))
-                        narration_idx = load_index(os.path.join(tmp_dir, 'narration_index.json'))
+                        if prompts_idx is None:
+                            prompts_idx = load_index(os.path.join(tmp_dir, 'prompts_index.json'))
+                        if narration_idx is None:
+                            narration_idx = load_index(os.path.join(tmp_dir, 'narration_index.json'))
                     except Exception:
                         prompts_idx = None
                         narration_idx = None
@@ -314,10 +688,15 @@ class ProjectTab(QWidget):
 class OutlineTab(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
-        self.thread: Optional[QThread] = None
-        self.worker: Optional[AsyncRunner] = None
+        self.worker: Optional[SubprocessController] = None
         self.base_config_data: Optional[dict] = None
-        self.settings = QSettings()
+        self.settings = _settings()
+        # Precomputed launch template; run_outline only patches per-run deltas.
+        # SubprocessController layers env overrides on top of the system
+        # environment, so there is no need to copy os.environ here.
+        self._script_path = os.path.join("outline-generator", "generate_outline.py")
+        self._base_cmd: tuple[str, ...] = (sys.executable, self._script_path)
+        self._base_env: dict[str, str] = {"PYTHONIOENCODING": "utf-8"}
 
         v = QVBoxLayout(self)
 
@@ -325,12 +704,11 @@ class OutlineTab(QWidget):
         self.lbl_output_root = QLabel("", self)
         v.addWidget(self.lbl_output_root)
         # update label with current output root
-        from .utils.path_resolver import PathResolver
         self.lbl_output_root.setText(f"Output root: {PathResolver.osnova_root()}")
 
         # Languages
         row_lang = QHBoxLayout()
-        self.chk = {code: QCheckBox(code) for code in ["CS", "EN", "DE", "ES", "FR"]}
+        self.chk = {code: QCheckBox(code) for code in _LANG_CODES}
         for c in self.chk.values():
             c.setChecked(True)
             row_lang.addWidget(c)
@@ -445,7 +823,7 @@ class OutlineTab(QWidget):
         g.addRow("Series context sentences:", row_scs)
         # Ordering
         self.cmb_ordering = QComboBox(self)
-        self.cmb_ordering.addItems(["chronological", "thematic"])
+        self.cmb_ordering.addItems(_ORDERINGS)
         g.addRow("Ordering:", self.cmb_ordering)
         # Tolerances
         row_tol = QWidget(self)
@@ -469,7 +847,7 @@ class OutlineTab(QWidget):
         self.spn_src_max = QSpinBox(self)
         self.spn_src_max.setRange(1, 50)
         self.cmb_src_format = QComboBox(self)
-        self.cmb_src_format.addItems(["name-only", "with-url", "full-citation"])
+        self.cmb_src_format.addItems(_SRC_FORMATS)
         lay_src.addWidget(QLabel("per-episode min"))
         lay_src.addWidget(self.spn_src_min)
         lay_src.addWidget(QLabel("max"))
@@ -594,7 +972,7 @@ class OutlineTab(QWidget):
         self.spn_scs_max.setValue(int(get2(scs, "max", None, 2)))
         # Ordering
         ordering = str(get2(data, "ordering", "ORDERING", "chronological")).lower()
-        idx = max(0, ["chronological", "thematic"].index(ordering) if ordering in ["chronological", "thematic"] else 0)
+        idx = _ORDERING_IDX.get(ordering, 0)
         self.cmb_ordering.setCurrentIndex(idx)
         # Tolerances
         self.spn_tol_min.setValue(int(get2(data, "tolerance_min", "TOLERANCE_MIN", 10)))
@@ -605,7 +983,7 @@ class OutlineTab(QWidget):
         self.spn_src_min.setValue(int(get2(per_ep, "min", "min", 2)))
         self.spn_src_max.setValue(int(get2(per_ep, "max", "max", 4)))
         fmt = str(get2(sources, "format", "FORMAT", "name-only"))
-        fmt_idx = ["name-only", "with-url", "full-citation"].index(fmt) if fmt in ["name-only", "with-url", "full-citation"] else 0
+        fmt_idx = _SRC_FMT_IDX.get(fmt, 0)
         self.cmb_src_format.setCurrentIndex(fmt_idx)
         # Factuality
         factuality = get2(data, "factuality", "FACTUALITY", {}) or {}
@@ -679,12 +1057,12 @@ class OutlineTab(QWidget):
         self.save_prefs()
 
         # Build command to run repo-local script
-        script = os.path.join("outline-generator", "generate_outline.py")
+        script = self._script_path
         if not os.path.exists(script):
             self.log.append("stderr", f"Nenalezen skript: {script}")
             return
 
-        cmd: list[str] = [sys.executable, script]
+        cmd: list[str] = list(self._base_cmd)
 
         # Verbosity
         vlevel = int(self.cmb_verbose.currentData() or 0)
@@ -702,7 +1080,6 @@ class OutlineTab(QWidget):
         cmd += ["-c", tmp_cfg]
 
         # Always use PathResolver.osnova_root() for consistent output location
-        from .utils.path_resolver import PathResolver
         out = str(PathResolver.osnova_root())
         cmd += ["-o", out]
 
@@ -710,16 +1087,14 @@ class OutlineTab(QWidget):
         cmd += ["-l", *langs]
 
         # Flags
-        if self.chk_parallel.isChecked():
-            cmd.append("-p")
-        if self.chk_cache.isChecked():
-            cmd.append("--cache")
-        if self.chk_dry.isChecked():
-            cmd.append("--dry-run")
+        cmd.extend(flag for chk, flag in (
+            (self.chk_parallel, "-p"),
+            (self.chk_cache, "--cache"),
+            (self.chk_dry, "--dry-run"),
+        ) if chk.isChecked())
 
         # Env overrides for API + force UTF-8 stdout/stderr on Windows
-        env = os.environ.copy()
-        env["PYTHONIOENCODING"] = "utf-8"
+        env = self._base_env.copy()
         model = self.ed_model.text().strip()
         if model:
             env["GPT_MODEL"] = model
@@ -727,16 +1102,15 @@ class OutlineTab(QWidget):
         env["GPT_MAX_TOKENS"] = str(self.sp_max_tokens.value())
 
         # Launch using SubprocessController (QProcess)
-        self.thread, self.worker = _start_qprocess(cmd, env, self, self.log.append, self.on_finished)
+        self.worker = _start_qprocess(cmd, env, self, self.log.append, self.on_finished,
+                                      lines_cb=self.log.append_lines)
         self.btn_run.setEnabled(False)
 
     def on_finished(self, code: int) -> None:
         self.log.append("stdout", f"Process finished with exit code {code}")
         self.btn_run.setEnabled(True)
-        if self.thread:
-            self.thread.quit()
-            self.thread.wait()
-            self.thread = None
+        if self.worker:
+            self.worker.deleteLater()
             self.worker = None
         # Trigger refresh of PromptsTab after outline generation
         if code == 0:
@@ -782,14 +1156,14 @@ class OutlineTab(QWidget):
         self.spn_scs_min.setValue(int(s.value("outline/scs_min", self.spn_scs_min.value())))
         self.spn_scs_max.setValue(int(s.value("outline/scs_max", self.spn_scs_max.value())))
         ordering = str(s.value("outline/ordering", self.cmb_ordering.currentText()))
-        idx = ["chronological", "thematic"].index(ordering) if ordering in ["chronological", "thematic"] else 0
+        idx = _ORDERING_IDX.get(ordering, 0)
         self.cmb_ordering.setCurrentIndex(idx)
         self.spn_tol_min.setValue(int(s.value("outline/tol_min", self.spn_tol_min.value())))
         self.spn_tol_max.setValue(int(s.value("outline/tol_max", self.spn_tol_max.value())))
         self.spn_src_min.setValue(int(s.value("outline/src_min", self.spn_src_min.value())))
         self.spn_src_max.setValue(int(s.value("outline/src_max", self.spn_src_max.value())))
         src_fmt = str(s.value("outline/src_fmt", self.cmb_src_format.currentText()))
-        fmt_idx = ["name-only", "with-url", "full-citation"].index(src_fmt) if src_fmt in ["name-only", "with-url", "full-citation"] else 0
+        fmt_idx = _SRC_FMT_IDX.get(src_fmt, 0)
         self.cmb_src_format.setCurrentIndex(fmt_idx)
         self.chk_no_dialogue.setChecked(bool(int(s.value("outline/fac_no_dialogue", int(self.chk_no_dialogue.isChecked())))))
         self.chk_no_spec.setChecked(bool(int(s.value("outline/fac_no_spec", int(self.chk_no_spec.isChecked())))))
@@ -805,49 +1179,58 @@ class OutlineTab(QWidget):
         return True
 
     def save_prefs(self) -> None:
-        s = self.settings
-        s.setValue("outline/config_path", self.txt_config.text().strip())
-        s.setValue("outline/template_path", self.txt_template.text().strip())
-        s.setValue("outline/verbosity", int(self.cmb_verbose.currentIndex()))
-        s.setValue("outline/parallel", int(self.chk_parallel.isChecked()))
-        s.setValue("outline/cache", int(self.chk_cache.isChecked()))
-        s.setValue("outline/dry", int(self.chk_dry.isChecked()))
+        # Convert everything first so no widget access happens between writes
         langs = ",".join([c for c, w in self.chk.items() if w.isChecked()])
-        s.setValue("outline/langs", langs)
-        # Overrides
-        s.setValue("outline/topic", self.ed_topic.text().strip())
-        s.setValue("outline/episodes_auto", int(self.chk_ep_auto.isChecked()))
-        s.setValue("outline/episodes", int(self.spn_episodes.value()))
-        s.setValue("outline/episode_minutes", int(self.spn_ep_minutes.value()))
-        s.setValue("outline/ecr_min", int(self.spn_ecr_min.value()))
-        s.setValue("outline/ecr_max", int(self.spn_ecr_max.value()))
-        s.setValue("outline/msp_per", int(self.spn_msp_per.value()))
-        s.setValue("outline/msp_max_words", int(self.spn_msp_max_words.value()))
-        s.setValue("outline/desc_max_sent", int(self.spn_desc_max_sent.value()))
-        s.setValue("outline/scs_min", int(self.spn_scs_min.value()))
-        s.setValue("outline/scs_max", int(self.spn_scs_max.value()))
-        s.setValue("outline/ordering", self.cmb_ordering.currentText())
-        s.setValue("outline/tol_min", int(self.spn_tol_min.value()))
-        s.setValue("outline/tol_max", int(self.spn_tol_max.value()))
-        s.setValue("outline/src_min", int(self.spn_src_min.value()))
-        s.setValue("outline/src_max", int(self.spn_src_max.value()))
-        s.setValue("outline/src_fmt", self.cmb_src_format.currentText())
-        s.setValue("outline/fac_no_dialogue", int(self.chk_no_dialogue.isChecked()))
-        s.setValue("outline/fac_no_spec", int(self.chk_no_spec.isChecked()))
-        s.setValue("outline/fac_consensus", int(self.chk_consensus.isChecked()))
-        s.setValue("outline/fac_disputes", int(self.chk_disputes.isChecked()))
-        # API
-        s.setValue("outline/api_model", self.ed_model.text().strip())
-        s.setValue("outline/api_temp", float(self.ds_temp.value()))
-        s.setValue("outline/api_max_tokens", int(self.sp_max_tokens.value()))
+        values = [
+            ("config_path", self.txt_config.text().strip()),
+            ("template_path", self.txt_template.text().strip()),
+            ("verbosity", int(self.cmb_verbose.currentIndex())),
+            ("parallel", int(self.chk_parallel.isChecked())),
+            ("cache", int(self.chk_cache.isChecked())),
+            ("dry", int(self.chk_dry.isChecked())),
+            ("langs", langs),
+            # Overrides
+            ("topic", self.ed_topic.text().strip()),
+            ("episodes_auto", int(self.chk_ep_auto.isChecked())),
+            ("episodes", int(self.spn_episodes.value())),
+            ("episode_minutes", int(self.spn_ep_minutes.value())),
+            ("ecr_min", int(self.spn_ecr_min.value())),
+            ("ecr_max", int(self.spn_ecr_max.value())),
+            ("msp_per", int(self.spn_msp_per.value())),
+            ("msp_max_words", int(self.spn_msp_max_words.value())),
+            ("desc_max_sent", int(self.spn_desc_max_sent.value())),
+            ("scs_min", int(self.spn_scs_min.value())),
+            ("scs_max", int(self.spn_scs_max.value())),
+            ("ordering", self.cmb_ordering.currentText()),
+            ("tol_min", int(self.spn_tol_min.value())),
+            ("tol_max", int(self.spn_tol_max.value())),
+            ("src_min", int(self.spn_src_min.value())),
+            ("src_max", int(self.spn_src_max.value())),
+            ("src_fmt", self.cmb_src_format.currentText()),
+            ("fac_no_dialogue", int(self.chk_no_dialogue.isChecked())),
+            ("fac_no_spec", int(self.chk_no_spec.isChecked())),
+            ("fac_consensus", int(self.chk_consensus.isChecked())),
+            ("fac_disputes", int(self.chk_disputes.isChecked())),
+            # API
+            ("api_model", self.ed_model.text().strip()),
+            ("api_temp", float(self.ds_temp.value())),
+            ("api_max_tokens", int(self.sp_max_tokens.value())),
+        ]
+        s = self.settings
+        s.beginGroup("outline")
+        try:
+            s.update(_changed_values(s, values))
+        finally:
+            s.endGroup()
 
 
 class PromptsTab(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
-        self.thread: Optional[QThread] = None
-        self.worker: Optional[AsyncRunner] = None
-        self.settings = QSettings()
+        self.worker: Optional[SubprocessController] = None
+        self.settings = _settings()
+        # topic -> outline languages found on disk; cleared by refresh_topics
+        self._lang_cache: dict[str, list[str]] = {}
 
         v = QVBoxLayout(self)
 
@@ -895,7 +1278,7 @@ class PromptsTab(QWidget):
         v.addWidget(self.log)
 
                 # Init
-        self.cmb_topic.currentTextChanged.connect(self.on_topic_changed)
+        self._topic_change_timer = _connect_debounced(self.cmb_topic.currentTextChanged, self.on_topic_changed, self)
         self.refresh_topics()
         self.load_prefs()
         self.on_topic_changed(self.cmb_topic.currentText())
@@ -909,27 +1292,32 @@ class PromptsTab(QWidget):
         return str(PathResolver.prompts_root())
 
     def refresh_topics(self) -> None:
-        self.log.append('stdout', '=== PromptsTab.refresh_topics() START ===')
-
         # PromptsTab needs to show ALL topics from outline root (not just those with prompts)
         # because users need to select a topic to GENERATE prompts for it
         root = self.osnova_root()
-        self.log.append('stdout', f'Scanning outline root for available topics: {root}')
-        self.log.append('stdout', f'Path exists: {os.path.isdir(root)}')
+        # Per-entry tracing only at Debug verbosity; everything else is logged in one append
+        debug = int(self.cmb_verbose.currentData() or 0) >= 2
+        lines = [
+            '=== PromptsTab.refresh_topics() START ===',
+            f'Scanning outline root for available topics: {root}',
+        ]
 
         topics: list[str] = []
         try:
             if not os.path.isdir(root):
                 self.log.append('stderr', f'Outline root does not exist: {root}')
             else:
-                entries = os.listdir(root)
-                self.log.append('stdout', f'Found {len(entries)} entries in outline root')
-                for name in entries:
-                    full = os.path.join(root, name)
-                    self.log.append('stdout', f'  Checking: {name} -> isdir={os.path.isdir(full)}')
-                    if os.path.isdir(full):
-                        topics.append(name)
-                        self.log.append('stdout', f'    ✓ Added topic: {name}')
+                with os.scandir(root) as it:
+                    entries = list(it)
+                lines.append(f'Found {len(entries)} entries in outline root')
+                for entry in entries:
+                    is_dir = entry.is_dir()
+                    if debug:
+                        lines.append(f'  Checking: {entry.name} -> isdir={is_dir}')
+                    if is_dir:
+                        topics.append(entry.name)
+                        if debug:
+                            lines.append(f'    ✓ Added topic: {entry.name}')
         except Exception as e:
             self.log.append("stderr", f"Error scanning outline root: {e}")
             topics = []
@@ -937,14 +1325,13 @@ class PromptsTab(QWidget):
         topics.sort()
         # Filter out hidden folders (starting with dot)
         topics = [t for t in topics if not t.startswith('.')]
-        self.log.append('stdout', f'Final topics list ({len(topics)}): {topics}')
-        self.log.append('stdout', '=== PromptsTab.refresh_topics() END ===')
+        lines.append(f'Final topics list ({len(topics)}): {topics}')
+        lines.append('=== PromptsTab.refresh_topics() END ===')
+        self.log.append('stdout', '\n'.join(lines))
+        self._lang_cache.clear()
 
         cur = self.cmb_topic.currentText()
-        self.cmb_topic.blockSignals(True)
-        self.cmb_topic.clear()
-        self.cmb_topic.addItems(topics)
-        self.cmb_topic.blockSignals(False)
+        _replace_combo_items(self.cmb_topic, topics)
         # restore if possible
         if cur and cur in topics:
             self.cmb_topic.setCurrentText(cur)
@@ -957,17 +1344,10 @@ class PromptsTab(QWidget):
         self.cmb_lang.clear()
         if not topic:
             return
-        root = self.osnova_root()
-        topic_dir = os.path.join(root, topic)
-        langs = []
-        for code in ["CS", "EN", "DE", "ES", "FR"]:
-            # Support both unified and legacy outline layouts:
-            # unified: <root>/<topic>/<code>/osnova.json
-            # legacy project-structure: <root>/<topic>/<code>/01_outline/osnova.json
-            p1 = os.path.join(topic_dir, code, "osnova.json")
-            p2 = os.path.join(topic_dir, code, "01_outline", "osnova.json")
-            if os.path.isfile(p1) or os.path.isfile(p2):
-                langs.append(code)
+        langs = self._lang_cache.get(topic)
+        if langs is None:
+            langs = _outline_langs(os.path.join(self.osnova_root(), topic))
+            self._lang_cache[topic] = langs
         self.cmb_lang.addItems(langs)
         # ensure a current selection exists
         if langs and self.cmb_lang.currentIndex() < 0:
@@ -998,8 +1378,8 @@ class PromptsTab(QWidget):
         if self.chk_overwrite.isChecked():
             cmd.append("-y")
 
-        env = os.environ.copy()
-        env["PYTHONIOENCODING"] = "utf-8"
+        # overrides only; SubprocessController.start merges them into the system environment
+        env = {"PYTHONIOENCODING": "utf-8"}
         # Ensure NC_OUTPUTS_ROOT is set so generate_prompts.py finds the right paths
         nc_root = os.environ.get("NC_OUTPUTS_ROOT")
         if not nc_root:
@@ -1009,16 +1389,15 @@ class PromptsTab(QWidget):
             self.log.append("stdout", f"Setting NC_OUTPUTS_ROOT={nc_root}")
 
         # Launch using SubprocessController (QProcess)
-        self.thread, self.worker = _start_qprocess(cmd, env, self, self.log.append, self.on_finished)
+        self.worker = _start_qprocess(cmd, env, self, self.log.append, self.on_finished,
+                                      lines_cb=self.log.append_lines)
         self.btn_run.setEnabled(False)
 
     def on_finished(self, code: int) -> None:
         self.log.append("stdout", f"Process finished with exit code {code}")
         self.btn_run.setEnabled(True)
-        if self.thread:
-            self.thread.quit()
-            self.thread.wait()
-            self.thread = None
+        if self.worker:
+            self.worker.deleteLater()
             self.worker = None
 
     def load_prefs(self) -> None:
@@ -1040,11 +1419,18 @@ class PromptsTab(QWidget):
             pass
 
     def save_prefs(self) -> None:
+        values = [
+            ("topic", self.cmb_topic.currentText().strip()),
+            ("lang", self.cmb_lang.currentText().strip()),
+            ("overwrite", int(self.chk_overwrite.isChecked())),
+            ("verbosity", int(self.cmb_verbose.currentIndex())),
+        ]
         s = self.settings
-        s.setValue("prompts/topic", self.cmb_topic.currentText().strip())
-        s.setValue("prompts/lang", self.cmb_lang.currentText().strip())
-        s.setValue("prompts/overwrite", int(self.chk_overwrite.isChecked()))
-        s.setValue("prompts/verbosity", int(self.cmb_verbose.currentIndex()))
+        s.beginGroup("prompts")
+        try:
+            s.update(_changed_values(s, values))
+        finally:
+            s.endGroup()
 
 
     def set_narration_index(self, index: dict) -> None:
@@ -1055,37 +1441,62 @@ class PromptsTab(QWidget):
         except Exception:
             pass  # Silently ignore refresh errors
 
-class NarrationTab(QWidget):
-    # Delegate methods using shared utils (kept as class methods for backward compatibility)
-    def _resolve_topic_dir(self, root: str | Path, topic_display: str) -> str:
+class _IndexScanSignals(QObject):
+    result_ready = Signal(int, object, object)  # epoch, prompts index, narration index
+
+
+class _IndexScanTask(QRunnable):
+    """Scans the prompts and narration roots on a QThreadPool worker."""
+
+    def __init__(self, epoch: int, prompts_root: str, narration_root: str) -> None:
+        super().__init__()
+        # Created on the UI thread, so result_ready is delivered there (queued)
+        self.signals = _IndexScanSignals()
+        self.epoch = epoch
+        self.prompts_root = prompts_root
+        self.narration_root = narration_root
+
+    def run(self) -> None:
         try:
-            p = resolve_topic_dir(Path(root), topic_display)
-            return str(p)
+            prompt_index = scan_prompts_root(self.prompts_root)
         except Exception:
-            try:
-                return os.path.join(str(root), topic_display)
-            except Exception:
-                return str(Path(root) / topic_display)
-
-    def _normalize_name(self, s: str) -> str:
+            prompt_index = None
         try:
-            return normalize_name(s)
+            narration_index = scan_narration_root(self.narration_root)
         except Exception:
-            return s.lower().strip()
+            narration_index = None
+        self.signals.result_ready.emit(self.epoch, prompt_index, narration_index)
+
+
+class _TopicScanSignals(QObject):
+    result_ready = Signal(int, object, object)  # epoch, sorted topic names, error message or None
 
-    def _find_index_topic(self, topic_display: str, index: dict | None) -> str | None:
+
+class _TopicScanTask(QRunnable):
+    """Lists the topic folders of ``root`` on a QThreadPool worker."""
+
+    def __init__(self, epoch: int, root: str) -> None:
+        super().__init__()
+        # Created on the UI thread, so result_ready is delivered there (queued)
+        self.signals = _TopicScanSignals()
+        self.epoch = epoch
+        self.root = root
+
+    def run(self) -> None:
         try:
-            return find_topic_in_index(topic_display, index)
-        except Exception:
-            return None
+            with os.scandir(self.root) as it:
+                topics = sorted(e.name for e in it if e.is_dir() and not e.name.startswith('.'))
+            error = None
+        except Exception as e:
+            topics, error = [], str(e)
+        self.signals.result_ready.emit(self.epoch, topics, error)
 
-    # NarrationTab
 
+class NarrationTab(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
-        self.thread: Optional[QThread] = None
         self.worker: Optional[SubprocessController] = None
-        self.settings = QSettings()
+        self.settings = _settings()
 
         v = QVBoxLayout(self)
 
@@ -1111,32 +1522,54 @@ class NarrationTab(QWidget):
         v.addWidget(self.lbl_prompts_root)
 
         # Episodes list (selectable)
-        self.lst_episodes = QListWidget(self)
-        self.lst_episodes.setSelectionMode(QListWidget.SingleSelection)
-        self.lst_episodes.itemSelectionChanged.connect(self._on_episode_selected)
-        self.lst_episodes.itemDoubleClicked.connect(lambda it: self.run_claude_episode())
+        self.lst_episodes = _row_list_view(self)
+        self.lst_episodes.selectionModel().selectionChanged.connect(self._on_episode_selected)
+        # a model reset drops the selection without selectionChanged
+        self.lst_episodes.model().modelReset.connect(self._on_episode_selected)
+        self.lst_episodes.doubleClicked.connect(lambda idx: self.run_claude_episode())
         v.addWidget(self.lst_episodes)
 
         # Prompts list for selected episode
         self.lbl_prompts = QLabel("Prompts:", self)
         v.addWidget(self.lbl_prompts)
-        self.lst_prompts = QListWidget(self)
-        self.lst_prompts.setSelectionMode(QListWidget.SingleSelection)
-        self.lst_prompts.itemSelectionChanged.connect(self._on_prompt_selected)
-        self.lst_prompts.itemDoubleClicked.connect(lambda it: self.run_selected_prompt())
+        self.lst_prompts = _row_list_view(self)
+        self.lst_prompts.selectionModel().selectionChanged.connect(self._on_prompt_selected)
+        self.lst_prompts.model().modelReset.connect(self._on_prompt_selected)
+        self.lst_prompts.doubleClicked.connect(lambda idx: self.run_selected_prompt())
         v.addWidget(self.lst_prompts)
 
         # Segments list for selected episode (to track generation status)
         self.lbl_segments = QLabel("Segments:", self)
         v.addWidget(self.lbl_segments)
-        self.lst_segments = QListWidget(self)
-        self.lst_segments.setSelectionMode(QListWidget.SingleSelection)
+        self.lst_segments = _row_list_view(self)
         v.addWidget(self.lst_segments)
 
         # Initialize state
         self._status_map: dict[str, str] = {}
         self._prompt_index: Optional[dict] = None
         self._narration_index: Optional[dict] = None
+        # On-disk prompts index (written by ProjectTab rescan), re-read only when its mtime changes
+        self._prompts_index_path = os.path.join('studio_gui', '.tmp', 'prompts_index.json')
+        self._prompts_index_mtime: Optional[int] = None
+        self._prompts_index_disk: Optional[dict] = None
+        # id(index) -> (index, {normalize_name(topic): topic}, {looked-up topic: key or None})
+        # for the indexes held above, rebuilt by _index_assigned whenever one of them is replaced
+        self._topic_key_maps: dict[int, tuple[dict, dict[str, str], dict[str, Optional[str]]]] = {}
+        # on_topic_changed state: last handled topic, per-topic (dir mtimes, langs, folder map)
+        # and the root mtimes the current indexes were scanned at
+        self._last_topic: Optional[str] = None
+        self._topic_cache: dict[str, tuple[tuple, list[str], dict[str, str]]] = {}
+        self._lang_folder_map: dict[str, str] = {}  # upper-case lang code -> folder name, set per topic
+        self._roots_mtime: Optional[tuple] = None
+        # Background index scans: results carry their epoch, only the latest is applied
+        self._scan_epoch = 0
+        self._scan_stamp: Optional[tuple] = None
+        self._scan_task: Optional[_IndexScanTask] = None
+        self._topics_epoch = 0
+        self._topics_task: Optional[_TopicScanTask] = None
+        # Filesystem fallback counts for populate_episodes: path -> (mtime_ns, count)
+        self._segment_count_cache: dict[str, tuple[int, int]] = {}
+        self._segment_total_cache: dict[str, tuple[int, int]] = {}
 
         opts = QHBoxLayout()
         self.chk_retry_failed = QCheckBox("Retry failed only", self)
@@ -1172,76 +1605,101 @@ class NarrationTab(QWidget):
         self.log = LogPane()
         v.addWidget(self.log)
 
-        self.cmb_topic.currentTextChanged.connect(self.on_topic_changed)
+        self._topic_change_timer = _connect_debounced(self.cmb_topic.currentTextChanged, self.on_topic_changed, self)
         self.cmb_lang.currentTextChanged.connect(lambda: self.populate_episodes())
+        # Topic list may arrive asynchronously; _apply_topics then populates the first topic
         self.refresh_topics()
 
-        # After loading topics, trigger language/episode population for first topic
-        # Use QTimer to ensure it runs after UI is fully initialized
-        if self.cmb_topic.count() > 0:
-            QTimer.singleShot(0, lambda: self.on_topic_changed(self.cmb_topic.currentText()))
+    # Delegates to the shared utils; those already fall back internally
+    # (normalize_name / resolve_topic_dir never raise), so no extra guards here.
     def _normalize_name(self, s: str) -> str:
         """Normalize name for case/diacritics-insensitive comparison (delegates to utils)."""
         return normalize_name(s)
 
     def _resolve_topic_dir(self, root, topic_display: str) -> str:
-        """Resolve topic directory with case-insensitive matching (delegates to utils)."""
-        from pathlib import Path
-        return str(resolve_topic_dir(Path(root), topic_display))
+        """Resolve topic directory with case-insensitive matching (delegates to utils, memoized)."""
+        return _resolve_topic_dir_cached(str(root), topic_display)
+
+    @property
+    def _debug_enabled(self) -> bool:
+        """Trace lines go to the log pane only when the GUI runs with DEBUG logging."""
+        return logging.getLogger().isEnabledFor(logging.DEBUG)
+
+    def _reset_index_caches(self) -> None:
+        self._topic_cache.clear()
+
+    def _index_assigned(self) -> None:
+        """Rebuild the normalized topic maps after an index attribute was replaced."""
+        maps = {}
+        for index in (self._prompt_index, self._narration_index, self._prompts_index_disk):
+            if not isinstance(index, dict):
+                continue
+            entry = self._topic_key_maps.get(id(index))
+            if entry is None or entry[0] is not index:
+                entry = (index, topic_key_map(index), {})
+            maps[id(index)] = entry
+        self._topic_key_maps = maps
 
     def _find_index_topic(self, topic_display: str, index) -> str | None:
         """Find topic in index with normalized matching (delegates to utils)."""
-        return find_topic_in_index(topic_display, index)
+        entry = self._topic_key_maps.get(id(index))
+        if entry is None or entry[0] is not index:
+            return find_topic_in_index(topic_display, index)
+        _, key_map, found = entry
+        try:
+            return found[topic_display]
+        except KeyError:
+            key = found[topic_display] = find_topic_in_index(topic_display, index, key_map)
+            return key
 
     def prompts_root(self) -> str:
-        pr_root = os.environ.get("PROMPTS_OUTPUT_ROOT")
-        if pr_root:
-            return pr_root
-        nc_root = os.environ.get("NC_OUTPUTS_ROOT")
-        if nc_root:
-            return os.path.join(nc_root, "prompts")
-        repo_root = os.getcwd()
-        return os.path.join(repo_root, "outputs", "prompts")
+        """Delegate to PathResolver for prompts root."""
+        return str(PathResolver.prompts_root())
 
     def osnova_root(self) -> str:
-        # Unified outputs structure detection with sensible fallbacks (for label only)
-        out_root = os.environ.get("OUTLINE_OUTPUT_ROOT")
-        if out_root:
-            return out_root
-        nc_root = os.environ.get("NC_OUTPUTS_ROOT")
-        if nc_root:
-            return os.path.join(nc_root, "outline")
+        """Delegate to PathResolver; with nothing configured and no outputs/outline
+        yet, fall back to the legacy outline-generator output folders."""
+        root = str(PathResolver.osnova_root())
         repo_root = os.getcwd()
-        unified = os.path.join(repo_root, "outputs", "outline")
-        legacy = os.path.join(repo_root, "outline-generator", "output")
-        default_out = os.path.join(repo_root, "output")
-        if os.path.isdir(unified):
-            return unified
-        if os.path.isdir(legacy):
-            return legacy
-        if os.path.isdir(default_out):
-            return default_out
-        return unified
+        if root != os.path.join(repo_root, "outputs", "outline") or os.path.isdir(root):
+            return root
+        for legacy in (os.path.join(repo_root, "outline-generator", "output"),
+                       os.path.join(repo_root, "output")):
+            if os.path.isdir(legacy):
+                return legacy
+        return root
 
     def narration_root(self) -> str:
-        nr = os.environ.get("NARRATION_OUTPUT_ROOT")
-        if nr:
-            return nr
-        nc_root = os.environ.get("NC_OUTPUTS_ROOT")
-        if nc_root:
-            return os.path.join(nc_root, "narration")
-        # fallback to repository-level outputs/narration
-        repo_root = os.getcwd()
-        return os.path.join(repo_root, "outputs", "narration")
+        """Delegate to PathResolver for narration root."""
+        return str(PathResolver.narration_root())
+
+    def _load_prompts_index_file(self) -> Optional[dict]:
+        """Return the on-disk prompts index, parsing it again only if the file changed."""
+        try:
+            mtime = os.stat(self._prompts_index_path).st_mtime_ns
+        except OSError:
+            if self._prompts_index_disk is not None:
+                self._prompts_index_disk = None
+                self._index_assigned()
+            self._prompts_index_mtime = None
+            return None
+        if mtime != self._prompts_index_mtime:
+            try:
+                self._prompts_index_disk = load_index(self._prompts_index_path)
+            except Exception:
+                self._prompts_index_disk = None
+            self._prompts_index_mtime = mtime
+            self._index_assigned()
+        return self._prompts_index_disk
 
     def refresh_topics(self) -> None:
+        # Folders may have appeared or been renamed since the last refresh
+        _resolve_topic_dir_cached.cache_clear()
+        clear_dir_cache()
+        self._last_topic = None
+        self._roots_mtime = None
         # Try to load cached prompts index for faster topic listing
-        try:
-            tmp_dir = os.path.join('studio_gui', '.tmp')
-            from .fs_index import load_index
-            idx = load_index(os.path.join(tmp_dir, 'prompts_index.json'))
-        except Exception:
-            idx = None
+        idx = self._load_prompts_index_file()
 
         topics: list[str] = []
         if idx:
@@ -1249,24 +1707,35 @@ class NarrationTab(QWidget):
                 topics = sorted(idx.get('topics', {}).keys())
             except Exception:
                 topics = []
-        # If no prompts topics found, fall back to outline topics to at least enable language selection
-        if not topics:
-            root = self.osnova_root()
-            try:
-                for name in os.listdir(root):
-                    full = os.path.join(root, name)
-                    if os.path.isdir(full):
-                        topics.append(name)
-            except Exception as e:
-                self.log.append("stderr", f"Nelze načíst témata z {root}: {e}")
-                topics = []
-            topics.sort()
 
+        # Update roots info labels
+        self.lbl_outline_root.setText(f"Outline root: {self.osnova_root()}")
+        self.lbl_prompts_root.setText(f"Prompts root: {self.prompts_root()}")
+
+        # A newer refresh supersedes any folder listing still in flight
+        self._topics_epoch += 1
+        if topics:
+            self._topics_task = None
+            self._apply_topics(topics)
+            return
+        # If no prompts topics found, fall back to outline topics to at least enable
+        # language selection; list them off the UI thread (slow/network mounts)
+        task = _TopicScanTask(self._topics_epoch, self.osnova_root())
+        task.signals.result_ready.connect(self._on_topic_scan_ready)
+        self._topics_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_topic_scan_ready(self, epoch: int, topics: list[str], error: Optional[str]) -> None:
+        if epoch != self._topics_epoch:
+            return
+        self._topics_task = None
+        if error:
+            self.log.append("stderr", f"Nelze načíst témata z {self.osnova_root()}: {error}")
+        self._apply_topics(topics)
+
+    def _apply_topics(self, topics: list[str]) -> None:
         cur = self.cmb_topic.currentText()
-        self.cmb_topic.blockSignals(True)
-        self.cmb_topic.clear()
-        self.cmb_topic.addItems(topics)
-        self.cmb_topic.blockSignals(False)
+        _replace_combo_items(self.cmb_topic, topics)
 
         # Auto-select first topic if nothing was selected before, or restore previous
         if topics:
@@ -1274,10 +1743,9 @@ class NarrationTab(QWidget):
                 self.cmb_topic.setCurrentText(cur)
             elif not cur:
                 self.cmb_topic.setCurrentIndex(0)
-
-        # Update roots info labels
-        self.lbl_outline_root.setText(f"Outline root: {self.osnova_root()}")
-        self.lbl_prompts_root.setText(f"Prompts root: {self.prompts_root()}")
+            # Trigger language/episode population for the shown topic (the combo was
+            # refilled with signals blocked). Deferred so it runs after the UI is set up.
+            QTimer.singleShot(0, lambda: self.on_topic_changed(self.cmb_topic.currentText()))
 
     def _force_populate_from_index(self, topic: str) -> bool:
         """Best-effort immediate UI population from narration index without relying on signals.
@@ -1287,10 +1755,12 @@ class NarrationTab(QWidget):
             key = self._find_index_topic(topic, idx)
             if not key:
                 return False
-            langs = list(idx.get('topics', {}).get(key, {}).get('languages', {}).keys())
-            langs = sorted(set([str(l).upper() for l in langs]))
-            self.cmb_lang.clear()
-            self.cmb_lang.addItems(langs)
+            lang_map = idx.get('topics', {}).get(key, {}).get('languages', {})
+            langs = sorted({str(l).upper() for l in lang_map})
+            # the episode list is filled right here, so don't let cmb_lang trigger populate_episodes
+            with QSignalBlocker(self.cmb_lang):
+                self.cmb_lang.clear()
+                self.cmb_lang.addItems(langs)
             if langs:
                 # log and select first language
                 try:
@@ -1300,29 +1770,22 @@ class NarrationTab(QWidget):
                 self.cmb_lang.setCurrentIndex(0)
                 # populate episodes directly from index
                 eps_map = idx['topics'][key]['languages'][langs[0]].get('episodes', {})
-                self.lst_episodes.clear()
-                for ep in sorted(eps_map.keys()):
-                    segs = eps_map[ep].get('segments', []) or []
-                    generated = len(segs)
+                sorted_eps = sorted(eps_map.items())
+                texts = []
+                for ep, info in sorted_eps:
+                    generated = len(info.get('segments', []) or [])
                     # no total here; we set as PARTIAL/PENDING depending on generated
                     status = 'PENDING' if generated == 0 else 'PARTIAL'
-                    item_text = f"{ep}: {generated}/? -> {status}"
-                    item = QListWidgetItem(item_text)
-                    item.setData(Qt.UserRole, ep)
-                    self.lst_episodes.addItem(item)
+                    texts.append(f"{ep}: {generated}/? -> {status}")
+                # Insert everything in one go and relayout the view once
+                self.lst_episodes.model().set_rows([(text, ep) for text, (ep, _info) in zip(texts, sorted_eps)])
                 return True
             return False
         except Exception:
             return False
 
-    def on_topic_changed(self, topic: str) -> None:
-        self.cmb_lang.clear()
-        if not topic:
-            return
-        try:
-            self.log.append('stdout', f'on_topic_changed: {topic}')
-        except Exception:
-            pass
+    def _resolve_topic_langs(self, topic: str, base_prompts: str, base_narr: str) -> tuple[list[str], dict[str, str]]:
+        """Languages available for ``topic`` plus the upper-case code -> folder name map."""
         debug_lines = [f"on_topic_changed: topic={topic}"]
         langs: list[str] = []
         # 1) Prefer using cached indexes if available (prompts index or narration index)
@@ -1353,98 +1816,139 @@ class NarrationTab(QWidget):
             debug_lines.append(f"index lookup error: {e}")
             langs = []
 
-        # 2) If still empty, fall back to filesystem checks (prompts -> narration -> outline)
+        # 2) If still empty, fall back to filesystem checks (prompts -> narration -> outline).
+        # The three probes are started together, so on slow mounts the wait is the
+        # slowest probe rather than the sum; results are still used in that order.
+        prompts_dirs: Optional[list[str]] = None  # reused for _lang_folder_map below
+        narr_dirs: Optional[list[str]] = None
         if not langs:
-            allowed = {"CS", "EN", "DE", "ES", "FR"}
-            base_prompts = self._resolve_topic_dir(self.prompts_root(), topic)
+            topic_dir = os.path.join(self.osnova_root(), topic)
+            probes = (_FS_POOL.submit(_scan_dirs, base_prompts),
+                      _FS_POOL.submit(_scan_dirs, base_narr),
+                      _FS_POOL.submit(_outline_langs, topic_dir))
             debug_lines.append(f"resolved prompts dir: {base_prompts}")
             try:
-                for name in os.listdir(base_prompts):
-                    if os.path.isdir(os.path.join(base_prompts, name)) and name.upper() in allowed:
-                        langs.append(name.upper())
+                prompts_dirs = probes[0].result()
+                langs.extend(n.upper() for n in prompts_dirs if n.upper() in _LANG_CODES_SET)
                 debug_lines.append(f"prompts detected langs: {langs}")
             except Exception as e:
                 debug_lines.append(f"prompts listing error: {e}")
 
-        if not langs:
-            base_narr = self._resolve_topic_dir(self.narration_root(), topic)
-            debug_lines.append(f"resolved narration dir: {base_narr}")
-            try:
-                for name in os.listdir(base_narr):
-                    if os.path.isdir(os.path.join(base_narr, name)) and name.upper() in {"CS","EN","DE","ES","FR"}:
-                        langs.append(name.upper())
-                debug_lines.append(f"narration detected langs: {langs}")
-            except Exception as e:
-                debug_lines.append(f"narration listing error: {e}")
+            if not langs:
+                debug_lines.append(f"resolved narration dir: {base_narr}")
+                try:
+                    narr_dirs = probes[1].result()
+                    langs.extend(n.upper() for n in narr_dirs if n.upper() in _LANG_CODES_SET)
+                    debug_lines.append(f"narration detected langs: {langs}")
+                except Exception as e:
+                    debug_lines.append(f"narration listing error: {e}")
 
-        if not langs:
-            root_outline = self.osnova_root()
-            topic_dir = os.path.join(root_outline, topic)
-            debug_lines.append(f"resolved outline dir: {topic_dir}")
-            try:
-                for code in ["CS", "EN", "DE", "ES", "FR"]:
-                    p1 = os.path.join(topic_dir, code, "osnova.json")
-                    p2 = os.path.join(topic_dir, code, "01_outline", "osnova.json")
-                    if os.path.isfile(p1) or os.path.isfile(p2):
-                        langs.append(code)
+            if not langs:
+                debug_lines.append(f"resolved outline dir: {topic_dir}")
+                langs.extend(probes[2].result())
                 debug_lines.append(f"outline detected langs: {langs}")
-            except Exception as e:
-                debug_lines.append(f"outline listing error: {e}")
+            for probe in probes:
+                probe.cancel()
 
-        langs = sorted(set([l.upper() for l in langs]))
-        self.cmb_lang.addItems(langs)
+        langs = sorted({l.upper() for l in langs})
+
+        # persist debug to disk (written by a background thread)
+        _debug_log(f"--- on_topic_changed at {datetime.now(timezone.utc).isoformat()}\n"
+                   + "".join(ln + "\n" for ln in debug_lines))
+
+        # Build mapping of uppercase lang code -> actual folder name for case-insensitive resolution
+        # (prompts topic dir if it exists, else narration topic dir)
+        names = prompts_dirs
+        if names is None:
+            try:
+                names = _scan_dirs(base_prompts)
+            except OSError:
+                try:
+                    names = narr_dirs if narr_dirs is not None else _scan_dirs(base_narr)
+                except OSError:
+                    names = []
+        return langs, {fn.upper(): fn for fn in names}
+
+    def _rescan_indexes_if_stale(self) -> None:
+        """Rebuild the prompts/narration indexes in the background unless both roots look unchanged.
+
+        Only the root folders' mtimes are compared, which catches added or removed
+        topics; deeper changes are picked up via Refresh or after a narration run,
+        both of which reset the stamp. Results arrive in _on_index_scan_ready.
+        """
+        prompts_root = discover_prompts_root()
+        narration_root = discover_narration_root()
+        stamp = (_mtime_ns(prompts_root), _mtime_ns(narration_root))
+        if None not in stamp and stamp in (self._roots_mtime, self._scan_stamp):
+            return
+        # A newer scan supersedes any in flight; its result is dropped by epoch
+        self._scan_epoch += 1
+        self._scan_stamp = stamp
+        task = _IndexScanTask(self._scan_epoch, prompts_root, narration_root)
+        task.signals.result_ready.connect(self._on_index_scan_ready)
+        self._scan_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_index_scan_ready(self, epoch: int, prompt_index, narration_index) -> None:
+        if epoch != self._scan_epoch:
+            return
+        self._reset_index_caches()
+        self._prompt_index = prompt_index
+        self._narration_index = narration_index
+        self._index_assigned()
+        self._roots_mtime, self._scan_stamp = self._scan_stamp, None
+        self._scan_task = None
+        self.populate_episodes()
+
+    def on_topic_changed(self, topic: str) -> None:
+        # currentTextChanged can re-deliver the topic that is already shown
+        if topic and topic == self._last_topic:
+            return
+        self._last_topic = topic
+        if not topic:
+            self.cmb_lang.clear()
+            return
+
+        # Languages and folder map are reused while neither topic folder changed
+        base_prompts = self._resolve_topic_dir(self.prompts_root(), topic)
+        base_narr = self._resolve_topic_dir(self.narration_root(), topic)
+        stamp = (_mtime_ns(base_prompts), _mtime_ns(base_narr))
+        cached = self._topic_cache.get(topic)
+        if cached is not None and cached[0] == stamp:
+            langs, folder_map = cached[1], cached[2]
+        else:
+            langs, folder_map = self._resolve_topic_langs(topic, base_prompts, base_narr)
+            self._topic_cache[topic] = (stamp, langs, folder_map)
+        self._lang_folder_map = folder_map
+
+        # populate_episodes runs once below; the combo must not trigger it for
+        # the clear and again for the first added item
+        with QSignalBlocker(self.cmb_lang):
+            self.cmb_lang.clear()
+            self.cmb_lang.addItems(langs)
         # ensure a current selection exists for downstream code (populate_episodes uses currentText)
         if langs and self.cmb_lang.currentIndex() < 0:
             self.cmb_lang.setCurrentIndex(0)
-        # immediate UI feedback
+        # immediate UI feedback (one append; the topic trace only when debugging)
+        lines = [f'on_topic_changed: {topic}'] if self._debug_enabled else []
         try:
             if langs:
-                self.log.append('stdout', f'Languages resolved: {langs}')
+                lines.append(f'Languages resolved: {langs}')
+                self.log.append('stdout', '\n'.join(lines))
             else:
+                if lines:
+                    self.log.append('stdout', lines[0])
                 self.log.append('stderr', 'No languages found for selected topic')
         except Exception:
             pass
 
-        # persist debug to disk
-        try:
-            tmpd = os.path.join('studio_gui', '.tmp')
-            os.makedirs(tmpd, exist_ok=True)
-            dbg_path = os.path.join(tmpd, 'narration_debug.log')
-            with open(dbg_path, 'a', encoding='utf-8') as df:
-                df.write(f"--- on_topic_changed at {datetime.now(timezone.utc).isoformat()}\n")
-                for ln in debug_lines:
-                    df.write(ln + "\n")
-        except Exception:
-            pass
-
-        # Build mapping of uppercase lang code -> actual folder name for case-insensitive resolution
-        try:
-            base_topic_dir = self._resolve_topic_dir(self.prompts_root(), topic) if os.path.isdir(self._resolve_topic_dir(self.prompts_root(), topic)) else self._resolve_topic_dir(self.narration_root(), topic)
-            folder_map = {}
-            try:
-                for fn in os.listdir(base_topic_dir):
-                    folder_map[fn.upper()] = fn
-            except Exception:
-                folder_map = {}
-            self._lang_folder_map = folder_map
-        except Exception:
-            self._lang_folder_map = {}
-
-        # after language list changed -> repopulate indexes and episodes using fs_index
-        try:
-            from .fs_index import scan_prompts_root, discover_prompts_root, scan_narration_root, discover_narration_root
-            try:
-                self._prompt_index = scan_prompts_root(discover_prompts_root())
-            except Exception:
-                self._prompt_index = None
-            try:
-                self._narration_index = scan_narration_root(discover_narration_root())
-            except Exception:
-                self._narration_index = None
-        except Exception:
-            self._prompt_index = None
-            self._narration_index = None
+        # Show what the current indexes/filesystem give right away; a background
+        # rescan (if the roots changed) repopulates once it finishes
         self.populate_episodes()
+        try:
+            self._rescan_indexes_if_stale()
+        except Exception as e:
+            self.log.append('stderr', f'Index rescan failed: {e}')
 
     def populate_episodes(self) -> None:
         topic = self.cmb_topic.currentText().strip()
@@ -1455,61 +1959,24 @@ class NarrationTab(QWidget):
                 lang = self.cmb_lang.itemText(0).strip()
             except Exception:
                 lang = ''
-        self.lst_episodes.clear()
         self.lbl_selected.setText("No episode selected")
         if not topic or not lang:
+            self.lst_episodes.model().clear()
             return
 
-                # DEBUG: Log what we're searching for
-        try:
-            self.log.append('stdout', f'[DEBUG] populate_episodes: topic={topic}, lang={lang}')
-        except Exception:
-            pass
+        rows = self._episode_rows(topic, lang)
+        self.lst_episodes.model().set_rows(rows)
 
-        if not topic or not lang:
+        if self._debug_enabled:
             try:
-                self.log.append('stderr', f'[DEBUG] Missing topic or lang, aborting')
+                self.log.append('stdout', f'[DEBUG] populate_episodes: topic={topic}, lang={lang}\n'
+                                          f'[DEBUG] Added {len(rows)} episodes to list')
             except Exception:
                 pass
-            return
-
-        base_topic_dir = self._resolve_topic_dir(self.narration_root(), topic)
-        base = os.path.join(base_topic_dir, lang)
-
-        # DEBUG: Log the path we're scanning
-        try:
-            self.log.append('stdout', f'[DEBUG] Scanning for episodes in: {base}')
-            self.log.append('stdout', f'[DEBUG] Path exists: {os.path.isdir(base)}')
-        except Exception:
-            pass
-
-        try:
-            eps = [d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d)) and d.startswith('ep')]
-            # DEBUG: Log what we found
-            try:
-                self.log.append('stdout', f'[DEBUG] Found {len(eps)} episodes: {eps}')
-            except Exception:
-                pass
-        except Exception as e:
-            # DEBUG: Log the error
-            try:
-                self.log.append('stderr', f'[DEBUG] Error listing episodes: {e}')
-            except Exception:
-                pass
-            eps = []
-
-        eps.sort()
-        for ep in eps:
-            item = QListWidgetItem(ep)
-            item.setData(Qt.UserRole, ep)
-            self.lst_episodes.addItem(item)
-
-        # DEBUG: Log final count
-        try:
-            self.log.append('stdout', f'[DEBUG] Added {len(eps)} episodes to list')
-        except Exception:
-            pass
 
+    def _episode_rows(self, topic: str, lang: str) -> list[tuple[str, Optional[str]]]:
+        """(display text, episode id) rows for the episode list, from the first source
+        that knows the topic: narration index, prompts index, then the filesystem."""
         # Prefer using precomputed indexes if available
         prompt_idx = getattr(self, '_prompt_index', None)
         narr_idx = getattr(self, '_narration_index', None)
@@ -1520,23 +1987,24 @@ class NarrationTab(QWidget):
                 key = self._find_index_topic(topic, narr_idx)
                 if key and narr_idx.get('topics', {}).get(key, {}).get('languages', {}).get(lang):
                     eps_map = narr_idx['topics'][key]['languages'][lang]['episodes']
-                    eps = sorted(eps_map.keys())
-                    for ep in eps:
-                        segs = eps_map[ep].get('segments', []) or []
-                        generated = len(segs)
-                        # try to detect expected total from prompts index if available
-                        total = 0
+                    # expected totals come from the prompts index, if available
+                    prompt_eps = {}
+                    if prompt_idx:
+                        prompt_eps = (prompt_idx.get('topics', {}).get(topic, {}).get('languages', {})
+                                      .get(lang, {}).get('episodes', {}) or {})
+                    rows = []
+                    for ep in sorted(eps_map):
+                        info = eps_map[ep]
+                        generated = info.get('segment_count')
+                        if generated is None:
+                            # index saved before segment_count existed
+                            generated = len(info.get('segments', []) or [])
                         try:
-                            if prompt_idx and prompt_idx.get('topics', {}).get(topic, {}).get('languages', {}).get(lang, {}).get('episodes', {}).get(ep):
-                                total = int(prompt_idx['topics'][topic]['languages'][lang]['episodes'][ep].get('expected_segments', 0) or 0)
+                            total = int((prompt_eps.get(ep) or {}).get('expected_segments', 0) or 0)
                         except Exception:
                             total = 0
-                        status = 'OK' if total and generated == total else ('PENDING' if generated == 0 else 'PARTIAL')
-                        item_text = f"{ep}: {generated}/{total} -> {status}"
-                        item = QListWidgetItem(item_text)
-                        item.setData(Qt.UserRole, ep)
-                        self.lst_episodes.addItem(item)
-                    return
+                        rows.append((f"{ep}: {generated}/{total} -> {episode_status(generated, total)}", ep))
+                    return rows
         except Exception:
             pass
 
@@ -1547,101 +2015,142 @@ class NarrationTab(QWidget):
                 if key and prompt_idx.get('topics', {}).get(key, {}).get('languages', {}).get(lang):
                     eps_map = prompt_idx['topics'][key]['languages'][lang]['episodes']
                 eps = sorted(eps_map.keys())
+                narr_eps = {}
+                if narr_idx:
+                    narr_key = self._find_index_topic(topic, narr_idx)
+                    if narr_key:
+                        narr_eps = (narr_idx.get('topics', {}).get(narr_key, {}).get('languages', {})
+                                    .get(lang, {}).get('episodes', {}) or {})
+                rows = []
                 for ep in eps:
                     info = eps_map[ep]
-                    generated = 0
-                    try:
-                        generated = sum(1 for p in info.get('prompts', []) if p['name'].lower().startswith('msp_') and p['name'].lower().endswith('.txt') and 'execution' in p['name'].lower())
-                    except Exception:
-                        generated = 0
-                    total = int(info.get('expected_segments', 0) or 0)
-                    if narr_idx:
+                    generated = info.get('execution_count')
+                    if generated is None:
+                        # index saved before execution_count existed
                         try:
-                            narr_key = self._find_index_topic(topic, narr_idx)
-                            if narr_key and narr_idx.get('topics', {}).get(narr_key, {}).get('languages', {}).get(lang, {}).get('episodes', {}).get(ep):
-                                segs = narr_idx['topics'][narr_key]['languages'][lang]['episodes'][ep].get('segments', [])
-                                generated = len(segs)
+                            generated = sum(1 for p in info.get('prompts', []) if is_execution_prompt(p['name']))
                         except Exception:
-                            pass
-                    status = 'OK' if total and generated == total else ('PENDING' if generated == 0 else 'PARTIAL')
-                    item_text = f"{ep}: {generated}/{total} -> {status}"
-                    item = QListWidgetItem(item_text)
-                    item.setData(Qt.UserRole, ep)
-                    self.lst_episodes.addItem(item)
-                return
+                            generated = 0
+                    total = int(info.get('expected_segments', 0) or 0)
+                    narr_ep = narr_eps.get(ep)
+                    if narr_ep:
+                        generated = narr_ep.get('segment_count')
+                        if generated is None:
+                            generated = len(narr_ep.get('segments', []) or [])
+                    rows.append((f"{ep}: {generated}/{total} -> {episode_status(generated, total)}", ep))
+                return rows
             except Exception:
                 pass
 
         # 3) Fallback: scan filesystem (prefer narration root if exists)
         base_topic_dir = self._resolve_topic_dir(self.narration_root(), topic)
-        # resolve actual folder name case-insensitively
-        try:
-            actual_lang = None
-            for fn in os.listdir(base_topic_dir):
-                if fn.upper() == lang.upper():
-                    actual_lang = fn
-                    break
-            if not actual_lang:
-                actual_lang = lang
-        except Exception:
-            actual_lang = lang
+        # resolve actual folder name case-insensitively (map built in on_topic_changed)
+        actual_lang = self._lang_folder_map.get(lang.upper(), lang)
         base = os.path.join(base_topic_dir, actual_lang)
+        if not os.path.isdir(base):
+            # the map comes from the prompts folder; narration may use another case
+            try:
+                actual_lang = next((fn for fn in _scan_dirs(base_topic_dir) if fn.upper() == lang.upper()), lang)
+            except OSError:
+                actual_lang = lang
+            base = os.path.join(base_topic_dir, actual_lang)
         eps = []
+        entries: dict[str, os.DirEntry] = {}
         try:
-            eps = [d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d)) and d.startswith('ep')]
-        except Exception as e:
+            entries = _scan_dir_entries(base, 'ep')
+            eps = list(entries)
+        except OSError as e:
             # try prompts meta as last resort
             try:
                 base_meta = os.path.join(self.prompts_root(), topic, lang)
-                eps = [d for d in os.listdir(base_meta) if os.path.isdir(os.path.join(base_meta, d)) and d.startswith('ep')]
-            except Exception as e2:
-                self.lst_episodes.addItem(f"ERROR: Nelze načíst epizody: {e or e2}")
-                return
+                eps = _scan_dirs(base_meta, 'ep')
+            except OSError as e2:
+                return [(f"ERROR: Nelze načíst epizody: {e or e2}", None)]
         eps.sort()
+        counts = self._fs_episode_counts(base, os.path.join(self.prompts_root(), topic, lang), eps, entries)
+        rows = []
+        for ep in eps:
+            generated, total = counts[ep]
+            rows.append((f"{ep}: {generated}/{total} -> {episode_status(generated, total)}", ep))
+        return rows
+
+    def _fs_episode_counts(self, base: str, meta_base: str, eps: list[str],
+                           entries: Optional[dict[str, os.DirEntry]] = None) -> dict[str, tuple[int, int]]:
+        """(generated, total) segment counts per episode, straight from the filesystem.
+
+        generated = segment_*.txt files in <base>/<ep>, total = segments listed in
+        <meta_base>/<ep>/meta/episode_context.json. Both are cached per path and
+        reused while the folder/file mtime is unchanged; meta files that do need
+        reading are parsed in parallel. ``entries`` (from _scan_dir_entries(base))
+        lets episode folders be stat'ed via DirEntry, which is free on Windows.
+        """
+        generated: dict[str, int] = {}
+        totals: dict[str, int] = {}
+        to_read: list[tuple[str, str, int]] = []
+        # path pieces joined once; the loop only concatenates the episode name
+        out_prefix = os.path.join(base, '')
+        meta_prefix = os.path.join(meta_base, '')
+        meta_suffix = os.sep + os.path.join('meta', 'episode_context.json')
         for ep in eps:
-            # total from prompts meta if available
-            total = 0
+            entry = entries.get(ep) if entries else None
             try:
-                meta = os.path.join(self.prompts_root(), topic, lang, ep, 'meta', 'episode_context.json')
-                if os.path.isfile(meta):
-                    with open(meta, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        total = len(data.get('segments', []))
-            except Exception:
-                total = 0
-            # generated from narration outputs
-            generated = 0
+                if entry is not None:
+                    out_dir = entry.path
+                    mtime = entry.stat().st_mtime_ns
+                else:
+                    out_dir = out_prefix + ep
+                    mtime = os.stat(out_dir).st_mtime_ns
+            except OSError:
+                mtime = None
+            hit = self._segment_count_cache.get(out_dir)
+            if hit is not None and mtime is not None and hit[0] == mtime:
+                generated[ep] = hit[1]
+            else:
+                try:
+                    generated[ep] = len(_scan_files(out_dir, '.txt', 'segment_'))
+                except OSError:
+                    generated[ep] = 0
+                if mtime is not None:
+                    self._segment_count_cache[out_dir] = (mtime, generated[ep])
+
+            meta = meta_prefix + ep + meta_suffix
             try:
-                out_dir = os.path.join(base, ep)
-                if os.path.isdir(out_dir):
-                    for name in os.listdir(out_dir):
-                        if name.startswith('segment_') and name.endswith('.txt'):
-                            generated += 1
-            except Exception:
-                generated = 0
-            status = 'OK' if total and generated == total else ('PENDING' if generated == 0 else 'PARTIAL')
-            item_text = f"{ep}: {generated}/{total} -> {status}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, ep)
-            self.lst_episodes.addItem(item)
+                mtime = os.stat(meta).st_mtime_ns
+            except OSError:
+                totals[ep] = 0
+                continue
+            hit = self._segment_total_cache.get(meta)
+            if hit is not None and hit[0] == mtime:
+                totals[ep] = hit[1]
+            else:
+                to_read.append((ep, meta, mtime))
+
+        if to_read:
+            paths = [meta for _ep, meta, _mtime in to_read]
+            if len(paths) == 1:
+                results = [_read_segment_total(paths[0])]
+            else:
+                results = list(_FS_POOL.map(_read_segment_total, paths))
+            for (ep, meta, mtime), total in zip(to_read, results):
+                totals[ep] = total
+                self._segment_total_cache[meta] = (mtime, total)
 
+        return {ep: (generated[ep], totals[ep]) for ep in eps}
 
     def run_claude(self) -> None:
         # legacy: not used for single-episode send
         self.log.append('stderr', 'Use "Send selected episode to Claude" to send a specific episode.')
 
     def _on_episode_selected(self) -> None:
-        items = self.lst_episodes.selectedItems()
+        row = _selected_row(self.lst_episodes)
         # clear prompts selection and list
-        self.lst_prompts.clear()
+        self.lst_prompts.model().clear()
         self.btn_send_prompt.setEnabled(False)
-        if not items:
+        if not row:
             self.lbl_selected.setText("No episode selected")
             self.btn_run.setEnabled(False)
             return
-        ep = items[0].data(Qt.UserRole)
-        if not ep:
-            ep = items[0].text()
+        ep = row[1] or row[0]
         self.lbl_selected.setText(f"Selected: {ep}")
         self.btn_run.setEnabled(True)
         # populate prompts list for this episode
@@ -1649,33 +2158,28 @@ class NarrationTab(QWidget):
         lang = self.cmb_lang.currentText().strip()
         self.populate_prompts_for_episode(topic, lang, ep)
         # populate segments list using narration index if available
-        self.lst_segments.clear()
-        self._status_map.clear()
         narr_idx = getattr(self, '_narration_index', None)
         if narr_idx and narr_idx.get('topics', {}).get(topic, {}).get('languages', {}).get(lang, {}).get('episodes', {}).get(ep):
             try:
                 segs = narr_idx['topics'][topic]['languages'][lang]['episodes'][ep].get('segments', [])
-                for s in segs:
-                    name = s.get('name')
-                    it = QListWidgetItem(f"{name} - PENDING")
-                    it.setData(Qt.UserRole, s.get('fullpath'))
-                    self.lst_segments.addItem(it)
-                    self._status_map[name] = 'PENDING'
+                self._add_segments([(s.get('name'), s.get('fullpath')) for s in segs])
                 return
             except Exception:
                 pass
         # fallback to filesystem
         seg_dir = os.path.join(self._resolve_topic_dir(self.narration_root(), topic), lang, ep)
         try:
-            names = [n for n in os.listdir(seg_dir) if n.endswith('.txt')]
-        except Exception:
+            names = _scan_files(seg_dir, '.txt')
+        except OSError:
             names = []
         names.sort()
-        for n in names:
-            it = QListWidgetItem(f"{n} - PENDING")
-            it.setData(Qt.UserRole, os.path.join(seg_dir, n))
-            self.lst_segments.addItem(it)
-            self._status_map[n] = 'PENDING'
+        prefix = os.path.join(seg_dir, '')
+        self._add_segments([(n, prefix + n) for n in names])
+
+    def _add_segments(self, pairs: list[tuple[str, str]]) -> None:
+        """Show (name, fullpath) segments in the segment list, all marked PENDING."""
+        self.lst_segments.model().set_rows([(f"{name} - PENDING", path) for name, path in pairs])
+        self._status_map = dict.fromkeys([name for name, _path in pairs], 'PENDING')
 
     def _update_pid_label(self) -> None:
         """Update PID label s process ID"""
@@ -1691,7 +2195,7 @@ class NarrationTab(QWidget):
 
     def populate_prompts_for_episode(self, topic: str, lang: str, ep: str) -> None:
         """Fill self.lst_prompts with prompt files for given topic/lang/ep."""
-        self.lst_prompts.clear()
+        self.lst_prompts.model().clear()
         if not topic or not lang or not ep:
             return
         # prefer index
@@ -1701,42 +2205,36 @@ class NarrationTab(QWidget):
                 key = self._find_index_topic(topic, self._prompt_index)
                 if key and self._prompt_index.get('topics', {}).get(key, {}).get('languages', {}).get(lang, {}).get('episodes', {}).get(ep):
                     pf = self._prompt_index['topics'][key]['languages'][lang]['episodes'][ep]['prompts']
-                for p in pf:
-                    item = QListWidgetItem(p['name'])
-                    item.setData(Qt.UserRole, p['fullpath'])
-                    self.lst_prompts.addItem(item)
+                self.lst_prompts.model().set_rows([(p['name'], p['fullpath']) for p in pf])
                 return
         except Exception:
             pass
         # fallback: filesystem scan
         prompts_dir = os.path.join(self.prompts_root(), topic, lang, ep, 'prompts')
         try:
-            for name in sorted(os.listdir(prompts_dir)):
-                fp = os.path.join(prompts_dir, name)
-                if os.path.isfile(fp):
-                    item = QListWidgetItem(name)
-                    item.setData(Qt.UserRole, fp)
-                    self.lst_prompts.addItem(item)
-        except Exception:
+            names = sorted(_scan_files(prompts_dir))
+        except OSError:
             return
+        prefix = os.path.join(prompts_dir, '')
+        self.lst_prompts.model().set_rows([(name, prefix + name) for name in names])
 
     def _on_prompt_selected(self) -> None:
-        items = self.lst_prompts.selectedItems()
-        if not items:
+        row = _selected_row(self.lst_prompts)
+        if not row:
             # leave episode selection label as is
             self.btn_send_prompt.setEnabled(False)
             return
-        prompt_name = items[0].text()
+        prompt_name = row[0]
         self.btn_send_prompt.setEnabled(True)
         # show which prompt selected in status label
         self.lbl_selected.setText(f"Selected: {prompt_name}")
 
     def run_selected_prompt(self) -> None:
-        items = self.lst_prompts.selectedItems()
-        if not items:
+        row = _selected_row(self.lst_prompts)
+        if not row:
             self.log.append('stderr', 'Vyberte prompt ze seznamu.')
             return
-        prompt_path = items[0].data(Qt.UserRole)
+        prompt_path = row[1]
         if not prompt_path:
             self.log.append('stderr', 'Nelze získat cestu k promptu')
             return
@@ -1745,21 +2243,20 @@ class NarrationTab(QWidget):
             self.log.append('stderr', f'Nenalezen runner: {runner}')
             return
         cmd = [sys.executable, runner, '--prompt-file', prompt_path]
-        env = os.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'
-        self.thread, self.worker = _start_qprocess(cmd, env, self, self.log.append, self.on_finished)
+        # overrides only; SubprocessController.start merges them into the system environment
+        env = {'PYTHONIOENCODING': 'utf-8'}
+        self.worker = _start_qprocess(cmd, env, self, self.log.append, self.on_finished,
+                                      lines_cb=self.log.append_lines)
         QTimer.singleShot(250, self._update_pid_label)
         self.btn_send_prompt.setEnabled(False)
 
     def run_claude_episode(self) -> None:
         # Decide whether to send whole episode or specific prompt(s)
-        items = self.lst_episodes.selectedItems()
-        if not items:
+        row = _selected_row(self.lst_episodes)
+        if not row:
             self.log.append('stderr', 'Vyberte epizodu ze seznamu.')
             return
-        ep = items[0].data(Qt.UserRole)
-        if not ep:
-            ep = items[0].text()
+        ep = row[1] or row[0]
         topic = self.cmb_topic.currentText().strip()
         lang = self.cmb_lang.currentText().strip()
         if not topic or not lang:
@@ -1820,10 +2317,11 @@ class NarrationTab(QWidget):
         if self.chk_retry_failed.isChecked():
             cmd.append('--retry-failed')
 
-        env = os.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'
+        # overrides only; SubprocessController.start merges them into the system environment
+        env = {'PYTHONIOENCODING': 'utf-8'}
         # Launch using SubprocessController
-        self.thread, self.worker = _start_qprocess(cmd, env, self, self.log.append, self.on_finished)
+        self.worker = _start_qprocess(cmd, env, self, self.log.append, self.on_finished,
+                                      lines_cb=self.log.append_lines)
         QTimer.singleShot(250, self._update_pid_label)
         self.btn_run.setEnabled(False)
 
@@ -1840,23 +2338,24 @@ class NarrationTab(QWidget):
     def on_finished(self, code: int) -> None:
         self.log.append('stdout', f'Process finished with exit code {code}')
         self.btn_run.setEnabled(True)
-        # refresh status
+        # refresh status (the run may have created the topic folder)
+        _resolve_topic_dir_cached.cache_clear()
+        clear_dir_cache()
+        self._roots_mtime = None
         self.populate_episodes()
-        if self.thread:
-            self.thread.quit()
-            self.thread.wait()
-            self.thread = None
+        if self.worker:
+            self.worker.deleteLater()
             self.worker = None
 
     def open_output_folder(self) -> None:
         """Otevře output složku pro vybranou epizodu, nebo narration root"""
         topic = self.cmb_topic.currentText().strip()
         lang = self.cmb_lang.currentText().strip()
-        items = self.lst_episodes.selectedItems()
+        row = _selected_row(self.lst_episodes)
 
-        if items and topic and lang:
+        if row and topic and lang:
             # Open specific episode folder
-            ep = items[0].text()
+            ep = row[0]
             path = Path(self.narration_root()) / topic / lang / ep
         elif topic and lang:
             # Open topic/lang folder
@@ -1893,6 +2392,8 @@ class NarrationTab(QWidget):
         """Set cached prompts index (from rescan) and refresh UI."""
         try:
             self._prompt_index = index
+            self._index_assigned()
+            self._reset_index_caches()
             try:
                 self.refresh_topics()
             except Exception:
@@ -1904,6 +2405,8 @@ class NarrationTab(QWidget):
         """Set cached narration index (from rescan) and refresh UI."""
         try:
             self._narration_index = index
+            self._index_assigned()
+            self._reset_index_caches()
             self.refresh_topics()
         except Exception:
             pass  # Silently ignore refresh errors
@@ -1912,9 +2415,8 @@ class NarrationTab(QWidget):
 class FinalTab(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
-        self.thread: Optional[QThread] = None
         self.worker: Optional[SubprocessController] = None
-        self.settings = QSettings()
+        self.settings = _settings()
 
         v = QVBoxLayout(self)
 
@@ -1985,20 +2487,17 @@ class FinalTab(QWidget):
 
     def refresh_topics(self) -> None:
         # list topics from narration root (since Final consumes narration outputs)
+        clear_dir_cache()
         topics: list[str] = []
         root = self.narration_root()
         try:
-            for name in os.listdir(root):
-                if os.path.isdir(os.path.join(root, name)) and not name.startswith('.'):
-                    topics.append(name)
+            with os.scandir(root) as it:
+                topics = [e.name for e in it if not e.name.startswith('.') and e.is_dir()]
         except Exception as e:
             self.log.append('stderr', f'Cannot list topics in {root}: {e}')
         topics.sort()
         cur = self.cmb_topic.currentText()
-        self.cmb_topic.blockSignals(True)
-        self.cmb_topic.clear()
-        self.cmb_topic.addItems(topics)
-        self.cmb_topic.blockSignals(False)
+        _replace_combo_items(self.cmb_topic, topics)
         if cur and cur in topics:
             self.cmb_topic.setCurrentText(cur)
         elif topics:
@@ -2007,19 +2506,18 @@ class FinalTab(QWidget):
         self.on_topic_changed(self.cmb_topic.currentText())
 
     def on_topic_changed(self, topic: str) -> None:
-        self.cmb_lang.clear()
         if not topic:
+            self.cmb_lang.clear()
             return
         base = os.path.join(self.narration_root(), topic)
-        langs = []
         try:
-            for name in os.listdir(base):
-                if os.path.isdir(os.path.join(base, name)) and name.upper() in {"CS","EN","DE","ES","FR"}:
-                    langs.append(name.upper())
-        except Exception:
-            pass
-        langs = sorted(set(langs))
-        self.cmb_lang.addItems(langs)
+            langs = sorted({n.upper() for n in _scan_dirs(base)} & _LANG_CODES_SET)
+        except OSError:
+            langs = []
+        # populate_episodes runs once below, not per combo change
+        with QSignalBlocker(self.cmb_lang):
+            self.cmb_lang.clear()
+            self.cmb_lang.addItems(langs)
         if langs:
             self.cmb_lang.setCurrentIndex(0)
         self.populate_episodes()
@@ -2033,10 +2531,9 @@ class FinalTab(QWidget):
         base = os.path.join(self.narration_root(), topic, lang)
         eps = []
         try:
-            for name in os.listdir(base):
-                if os.path.isdir(os.path.join(base, name)) and name.lower().startswith('ep'):
-                    eps.append(name)
-        except Exception:
+            with os.scandir(base) as it:
+                eps = [e.name for e in it if e.name.lower().startswith('ep') and e.is_dir()]
+        except OSError:
             pass
         eps.sort()
         self.cmb_episode.addItems(eps)
@@ -2084,13 +2581,14 @@ class FinalTab(QWidget):
         cmd += ['--length-words', self.ed_len.text().strip()]
         cmd += ['--sentence-len', self.ed_sent.text().strip()]
 
-        env = os.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'
+        # overrides only; SubprocessController.start merges them into the system environment
+        env = {'PYTHONIOENCODING': 'utf-8'}
         if self.ed_model.text().strip():
             env['GPT_MODEL'] = self.ed_model.text().strip()
         env['GPT_TEMPERATURE'] = str(self.ds_temp.value())
 
-        self.thread, self.worker = _start_qprocess(cmd, env, self, self.log.append, self.on_finished, cwd=os.getcwd())
+        self.worker = _start_qprocess(cmd, env, self, self.log.append, self.on_finished,
+                                      cwd=os.getcwd(), lines_cb=self.log.append_lines)
         QTimer.singleShot(250, self._update_pid_label)
         self.btn_run.setEnabled(False)
 
@@ -2126,10 +2624,8 @@ class FinalTab(QWidget):
     def on_finished(self, code: int) -> None:
         self.log.append('stdout', f'Process finished with exit code {code}')
         self.btn_run.setEnabled(True)
-        if self.thread:
-            self.thread.quit()
-            self.thread.wait()
-            self.thread = None
+        if self.worker:
+            self.worker.deleteLater()
             self.worker = None
 
 
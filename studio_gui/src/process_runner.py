@@ -6,6 +6,11 @@ from dataclasses import dataclass
 from typing import AsyncIterator, Optional
 
 
+# Put on the queue by each stream reader when its stream hits EOF
+_EOF = object()
+_READ_CHUNK = 65536
+
+
 @dataclass
 class ProcessEvent:
     stream: str  # "stdout" | "stderr"
@@ -45,31 +50,50 @@ class ProcessRunner:
     async def iter_lines(self) -> AsyncIterator[ProcessEvent]:
         assert self._proc and self._proc.stdout and self._proc.stderr
 
-        async def reader(stream: asyncio.StreamReader, name: str, q: asyncio.Queue[ProcessEvent]):
-            while True:
-                line = await stream.readline()
-                if not line:
-                    break
-                try:
-                    text = line.decode("utf-8", errors="replace").rstrip("\r\n")
-                except Exception:
-                    text = line.decode(errors="replace").rstrip("\r\n")
-                await q.put(ProcessEvent(name, text))
+        def decode(data: bytearray) -> str:
+            try:
+                return data.decode("utf-8", errors="replace")
+            except Exception:
+                return data.decode(errors="replace")
 
-        q: asyncio.Queue[ProcessEvent] = asyncio.Queue()
+        async def reader(stream: asyncio.StreamReader, name: str, q: asyncio.Queue):
+            # Read in large chunks and split complete lines out of a buffer: one
+            # await and one decode per chunk instead of per line. Splitting on
+            # b"\n" is safe for UTF-8, which never uses that byte inside a character.
+            buf = bytearray()
+            try:
+                while True:
+                    chunk = await stream.read(_READ_CHUNK)
+                    if not chunk:
+                        break
+                    buf += chunk
+                    nl = buf.rfind(b"\n")
+                    if nl == -1:
+                        continue
+                    text = decode(buf[:nl])
+                    del buf[:nl + 1]
+                    for line in text.split("\n"):
+                        q.put_nowait(ProcessEvent(name, line.rstrip("\r")))
+                if buf:
+                    # last line without a trailing newline
+                    q.put_nowait(ProcessEvent(name, decode(buf).rstrip("\r\n")))
+            finally:
+                # always signal EOF, even if reading failed, so the consumer cannot hang
+                q.put_nowait(_EOF)
+
+        q: asyncio.Queue = asyncio.Queue()
         t_out = asyncio.create_task(reader(self._proc.stdout, "stdout", q))
         t_err = asyncio.create_task(reader(self._proc.stderr, "stderr", q))
 
-        pending = {t_out, t_err}
+        open_streams = 2
         try:
-            while pending:
-                try:
-                    evt = await asyncio.wait_for(q.get(), timeout=0.05)
+            # Block on the queue until both readers have reported EOF; no polling
+            while open_streams:
+                evt = await q.get()
+                if evt is _EOF:
+                    open_streams -= 1
+                else:
                     yield evt
-                except asyncio.TimeoutError:
-                    if all(t.done() for t in pending):
-                        break
-                    pending = {t for t in pending if not t.done()}
         finally:
             # Ensure reader tasks are awaited to avoid warnings
             await asyncio.gather(t_out, t_err, return_exceptions=True)
@@ -1,7 +1,7 @@
 # python studio_gui/src/qprocess_runner.py
 from __future__ import annotations
 
-from PySide6.QtCore import QObject, QProcess, QByteArray, Signal, QTimer, QProcessEnvironment
+from PySide6.QtCore import QObject, QProcess, QByteArray, Signal, QTimer, QProcessEnvironment, QMetaMethod
 from typing import Optional
 import json
 
@@ -11,6 +11,7 @@ class SubprocessController(QObject):
 
     Signals:
       - started(): emitted when process starts
+      - log_chunk(stream: str, lines: list[str]): emitted once per read with all complete lines
       - log_line(stream: str, text: str): emitted per text line read from stdout/stderr
       - parsed_log(object): emitted when a stdout/stderr line parses as JSON (structlog)
       - error(msg: str): emitted on process start/errors
@@ -24,6 +25,7 @@ class SubprocessController(QObject):
     """
 
     started = Signal()
+    log_chunk = Signal(str, list)  # stream, [text, ...]
     log_line = Signal(str, str)  # stream, text
     parsed_log = Signal(object)  # parsed JSON object from structlog if any
     error = Signal(str)
@@ -34,7 +36,15 @@ class SubprocessController(QObject):
         self._proc = QProcess(self)
         self._stdout_buf = ""
         self._stderr_buf = ""
-        self._timeout_timer: Optional[QTimer] = None
+
+        # one timer each for the run timeout and the terminate -> kill grace period,
+        # reused across runs instead of allocating a QTimer per call
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.timeout.connect(self._on_timeout)
+        self._kill_timer = QTimer(self)
+        self._kill_timer.setSingleShot(True)
+        self._kill_timer.timeout.connect(self._kill_if_running)
 
         # keep stdout/stderr separate
         self._proc.readyReadStandardOutput.connect(self._on_stdout)
@@ -50,12 +60,13 @@ class SubprocessController(QObject):
         """
         args = args or []
 
-        # Merge environment: start from system environment and override with provided env
-        qenv = QProcessEnvironment.systemEnvironment()
+        # Merge environment: start from system environment and override with provided env.
+        # Without overrides QProcess simply inherits ours, so skip copying it.
         if env:
+            qenv = QProcessEnvironment.systemEnvironment()
             for k, v in env.items():
                 qenv.insert(str(k), str(v))
-        self._proc.setProcessEnvironment(qenv)
+            self._proc.setProcessEnvironment(qenv)
 
         if cwd:
             self._proc.setWorkingDirectory(cwd)
@@ -71,12 +82,9 @@ class SubprocessController(QObject):
             return
 
         # Setup timeout
+        self._timeout_timer.stop()
+        self._kill_timer.stop()
         if timeout and timeout > 0:
-            if self._timeout_timer:
-                self._timeout_timer.stop()
-            self._timeout_timer = QTimer(self)
-            self._timeout_timer.setSingleShot(True)
-            self._timeout_timer.timeout.connect(lambda: self._on_timeout())
             self._timeout_timer.start(int(timeout * 1000))
 
     def _on_started(self) -> None:
@@ -99,70 +107,86 @@ class SubprocessController(QObject):
             except Exception:
                 return ""
 
-    def _emit_line(self, stream: str, line: str) -> None:
-        text = line.rstrip("\r\n")
-        self.log_line.emit(stream, text)
-        # attempt to parse JSON structured log (structlog JSONRenderer)
-        try:
-            obj = json.loads(text)
-            # prefer to emit dicts only
-            if isinstance(obj, dict):
-                self.parsed_log.emit(obj)
-        except Exception:
-            pass
+    def _has_receivers(self, signal) -> bool:
+        return self.isSignalConnected(QMetaMethod.fromSignal(signal))
+
+    def _emit_lines(self, stream: str, lines: list[str]) -> None:
+        texts = [ln.rstrip("\r\n") for ln in lines]
+        self.log_chunk.emit(stream, texts)
+        # per-line signals only for listeners that still use them
+        per_line = self._has_receivers(self.log_line)
+        parse = self._has_receivers(self.parsed_log)
+        if not (per_line or parse):
+            return
+        for text in texts:
+            if per_line:
+                self.log_line.emit(stream, text)
+            # attempt to parse JSON structured log (structlog JSONRenderer)
+            if parse and text.lstrip().startswith("{"):
+                try:
+                    obj = json.loads(text)
+                    # prefer to emit dicts only
+                    if isinstance(obj, dict):
+                        self.parsed_log.emit(obj)
+                except Exception:
+                    pass
+
+    @staticmethod
+    def _split_complete(buf: str, text: str) -> tuple[list[str], str]:
+        """Complete lines in ``buf + text`` plus the unterminated tail to keep buffered.
+
+        A bare '\r' ends a line too, so carriage-return progress output (tqdm
+        and the like) is emitted as it arrives rather than at the next '\n'.
+        When a chunk ends in '\r' the tail is a lone '\r', so a '\n' opening
+        the next chunk is read as the rest of that '\r\n', not as an empty line.
+        """
+        if buf == "\r":
+            # the line this '\r' ended was already emitted with the previous chunk
+            combined = text[1:] if text.startswith("\n") else text
+        else:
+            combined = buf + text
+        end = max(combined.rfind("\n"), combined.rfind("\r"))
+        if end == -1:
+            return [], combined
+        tail = "\r" if combined.endswith("\r") else combined[end + 1:]
+        return combined[:end + 1].splitlines(), tail
 
     def _on_stdout(self) -> None:
         data = self._proc.readAllStandardOutput()
         text = self._read_bytes(data)
         if not text:
             return
-        combined = self._stdout_buf + text
-        lines = combined.splitlines(keepends=True)
-        # if last line doesn't end with newline, keep it in buffer
-        if lines and not lines[-1].endswith("\n") and not lines[-1].endswith("\r"):
-            self._stdout_buf = lines[-1]
-            lines = lines[:-1]
-        else:
-            self._stdout_buf = ""
-
-        for ln in lines:
-            self._emit_line("stdout", ln)
+        lines, self._stdout_buf = self._split_complete(self._stdout_buf, text)
+        if lines:
+            self._emit_lines("stdout", lines)
 
     def _on_stderr(self) -> None:
         data = self._proc.readAllStandardError()
         text = self._read_bytes(data)
         if not text:
             return
-        combined = self._stderr_buf + text
-        lines = combined.splitlines(keepends=True)
-        if lines and not lines[-1].endswith("\n") and not lines[-1].endswith("\r"):
-            self._stderr_buf = lines[-1]
-            lines = lines[:-1]
-        else:
-            self._stderr_buf = ""
-
-        for ln in lines:
-            self._emit_line("stderr", ln)
+        lines, self._stderr_buf = self._split_complete(self._stderr_buf, text)
+        if lines:
+            self._emit_lines("stderr", lines)
 
     def _on_timeout(self) -> None:
         # Graceful terminate then kill after short grace period
         if self._proc.state() != QProcess.NotRunning:
-            self.log_line.emit("stderr", "[qprocess_runner] Timeout reached, terminating process")
+            self._emit_lines("stderr", ["[qprocess_runner] Timeout reached, terminating process"])
             self.terminate(grace_period=5)
 
     def _on_finished(self, exitCode: int, exitStatus) -> None:
-        # stop timeout timer
-        if self._timeout_timer:
-            self._timeout_timer.stop()
-            self._timeout_timer = None
+        # stop timeout timer (and a pending kill: the process is gone)
+        self._timeout_timer.stop()
+        self._kill_timer.stop()
 
         # flush any remaining buffers
-        if self._stdout_buf:
-            self._emit_line("stdout", self._stdout_buf)
-            self._stdout_buf = ""
-        if self._stderr_buf:
-            self._emit_line("stderr", self._stderr_buf)
-            self._stderr_buf = ""
+        if self._stdout_buf not in ("", "\r"):  # a lone '\r' is only the end of the last line
+            self._emit_lines("stdout", [self._stdout_buf])
+        self._stdout_buf = ""
+        if self._stderr_buf not in ("", "\r"):  # a lone '\r' is only the end of the last line
+            self._emit_lines("stderr", [self._stderr_buf])
+        self._stderr_buf = ""
 
         try:
             status_int = int(exitStatus)
@@ -184,17 +208,14 @@ class SubprocessController(QObject):
             pass
 
         # schedule kill if still running
-        def _kill_if_running():
-            if self._proc.state() != QProcess.NotRunning:
-                try:
-                    self._proc.kill()
-                except Exception:
-                    pass
+        self._kill_timer.start(grace_period * 1000)
 
-        timer = QTimer(self)
-        timer.setSingleShot(True)
-        timer.timeout.connect(_kill_if_running)
-        timer.start(grace_period * 1000)
+    def _kill_if_running(self) -> None:
+        if self._proc.state() != QProcess.NotRunning:
+            try:
+                self._proc.kill()
+            except Exception:
+                pass
 
     def kill(self) -> None:
         if self._proc.state() != QProcess.NotRunning:
@@ -1,11 +1,15 @@
 """Utility modules for path resolution, filesystem helpers, and validation."""
 
 from .path_resolver import PathResolver
-from .fs_helpers import normalize_name, resolve_topic_dir, find_topic_in_index
+from .fs_helpers import normalize_name, resolve_topic_dir, find_topic_in_index, topic_key_map
+from .dir_cache import list_subdirs, clear_dir_cache
 
 __all__ = [
     "PathResolver",
     "normalize_name",
     "resolve_topic_dir",
     "find_topic_in_index",
+    "topic_key_map",
+    "list_subdirs",
+    "clear_dir_cache",
 ]
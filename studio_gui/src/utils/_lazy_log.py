@@ -0,0 +1,26 @@
+"""Logger placeholder that imports structlog on first use.
+
+The utils modules log only at debug level on their hot paths, so headless
+scripts that import them never need structlog loaded up front.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+
+class LazyLogger:
+    """Stand-in for ``structlog.get_logger(name)``, created on first attribute access."""
+
+    __slots__ = ("_name", "_logger")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._logger: Any = None
+
+    def __getattr__(self, attr: str) -> Any:
+        logger = self._logger
+        if logger is None:
+            import structlog
+
+            logger = self._logger = structlog.get_logger(self._name)
+        return getattr(logger, attr)
@@ -0,0 +1,65 @@
+"""Short-lived cache of subdirectory listings.
+
+The GUI lists the same topic/language folders over and over while the user
+clicks through topics. On network or FUSE mounts each listing is a round trip,
+so listings are memoized per path:
+
+- by default every call stat's the directory once, and the names are reused as
+  long as its mtime_ns is unchanged (adding/removing/renaming an entry bumps it);
+- callers that can live with a slightly stale listing may pass ``ttl`` to skip
+  even the stat within ``ttl`` seconds of the last check.
+
+The cache is shared by the GUI thread and the filesystem pool, so every access
+to it holds _lock (the stat and scandir themselves run outside the lock).
+Call clear_dir_cache() when the user asks for a refresh.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+# path -> (mtime_ns, checked_at (monotonic), subdirectory names)
+_cache: dict[str, tuple[int, float, tuple[str, ...]]] = {}
+_MAX_ENTRIES = 512
+_lock = threading.Lock()
+
+
+def list_subdirs(path: str, ttl: float = 0.0) -> list[str]:
+    """Names of subdirectories of ``path`` (unsorted), served from the cache when fresh.
+
+    Raises OSError if ``path`` cannot be stat'ed or listed.
+    """
+    return list(subdir_listing(path, ttl)[1])
+
+
+def subdir_listing(path: str, ttl: float = 0.0) -> tuple[int, tuple[str, ...]]:
+    """``(mtime_ns, names)`` of ``path`` as validated by list_subdirs.
+
+    For callers that key their own caches on the directory mtime without
+    stat'ing it a second time. Raises OSError like list_subdirs.
+    """
+    path = os.path.abspath(path)
+    now = time.monotonic()
+    with _lock:
+        hit = _cache.get(path)
+    if hit is not None and now - hit[1] < ttl:
+        return hit[0], hit[2]
+    mtime_ns = os.stat(path).st_mtime_ns
+    if hit is not None and hit[0] == mtime_ns:
+        with _lock:
+            _cache[path] = (mtime_ns, now, hit[2])
+        return mtime_ns, hit[2]
+    with os.scandir(path) as it:
+        names = tuple(e.name for e in it if e.is_dir())
+    with _lock:
+        if len(_cache) >= _MAX_ENTRIES:
+            _cache.clear()
+        _cache[path] = (mtime_ns, now, names)
+    return mtime_ns, names
+
+
+def clear_dir_cache() -> None:
+    """Forget all cached listings."""
+    with _lock:
+        _cache.clear()
@@ -1,37 +1,73 @@
 """Filesystem helpers for topic/episode resolution and normalization."""
 from __future__ import annotations
 
+import functools
 import unicodedata
 import re
 from pathlib import Path
 from typing import Optional
 
-import structlog
+from ._lazy_log import LazyLogger
+from .dir_cache import subdir_listing
 
-logger = structlog.get_logger(__name__)
+logger = LazyLogger(__name__)
 
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+_MULTI_UNDER = re.compile(r'_+')
 
+
+def _strip_marks(text: str) -> str:
+    """NFKD-decompose ``text`` and drop combining characters (diacritics)."""
+    nfd = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in nfd if not unicodedata.combining(ch))
+
+
+# Czech/Slovak and common Western accented letters -> ASCII, derived from
+# _strip_marks so the table can never disagree with the NFKD fallback
+_ACCENTED = 'áäàâãåčçďéěëèêíïìîĺľňñóöòôõőŕřšťúůüùûűýÿž'
+_DIACRITIC_TABLE = str.maketrans({
+    ch: _strip_marks(ch) for ch in _ACCENTED + _ACCENTED.upper() if _strip_marks(ch).isascii()
+})
+
+# root -> (root mtime_ns, {normalize_name(dir): dir}) for resolve_topic_dir, bounded like
+# the dir_cache listings it is built from
+_norm_index_cache: dict[str, tuple[int, dict[str, str]]] = {}
+_NORM_INDEX_MAX = 512
+# id(index) -> (index, {normalize_name(key): key}) for find_topic_in_index. Indexes are
+# replaced, never edited in place, so identity is a complete validity check; holding the
+# index also keeps its id() from being reused while the entry exists.
+_norm_key_index_cache: dict[int, tuple[dict, dict[str, str]]] = {}
+_NORM_KEY_CACHE_MAX = 4
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """Normalize name for case-insensitive, diacritics-insensitive comparison.
 
     Removes diacritics, converts to lowercase, replaces non-alphanumeric with _.
+    Results are memoized; ASCII names and names with only common accented
+    letters skip the Unicode decomposition.
     """
+    if name.isascii():
+        return _slugify(name)
+    # common accented letters go through a translate table; anything else
+    # still needs the Unicode decomposition
+    translated = name.translate(_DIACRITIC_TABLE)
+    if translated.isascii():
+        return _slugify(translated)
     try:
-        # Decompose and remove combining characters (diacritics)
-        nfd = unicodedata.normalize('NFKD', name)
-        ascii_str = ''.join(ch for ch in nfd if not unicodedata.combining(ch))
-
-        # Lowercase and slug-ify
-        slug = ascii_str.lower()
-        slug = re.sub(r'[^a-z0-9]+', '_', slug)
-        slug = re.sub(r'_+', '_', slug).strip('_')
-
-        return slug
+        return _slugify(_strip_marks(name))
     except Exception as e:
         logger.warning("normalize_name failed, using fallback", name=name, error=str(e))
         return name.lower().strip()
 
 
+def _slugify(text: str) -> str:
+    """Lowercase and collapse every non-alphanumeric run into a single _."""
+    slug = _NON_ALNUM.sub('_', text.lower())
+    return _MULTI_UNDER.sub('_', slug).strip('_')
+
+
 def resolve_topic_dir(root: Path, topic_display: str) -> Path:
     """Resolve topic directory with case-insensitive matching.
 
@@ -39,21 +75,22 @@ def resolve_topic_dir(root: Path, topic_display: str) -> Path:
     Returns path even if it doesn't exist (caller decides what to do).
     """
     exact = root / topic_display
-    if exact.exists() and exact.is_dir():
+    if exact.is_dir():
         logger.debug("resolve_topic_dir: exact match", root=str(root), topic=topic_display)
         return exact
 
     try:
-        if not root.exists():
+        try:
+            dir_index = _normalized_dir_index(str(root))
+        except (FileNotFoundError, NotADirectoryError):
             logger.debug("resolve_topic_dir: root doesn't exist, returning exact path", root=str(root))
             return exact
 
-        target_normalized = normalize_name(topic_display)
-        for entry in root.iterdir():
-            if entry.is_dir() and normalize_name(entry.name) == target_normalized:
-                logger.debug("resolve_topic_dir: normalized match",
-                             root=str(root), topic=topic_display, resolved=entry.name)
-                return entry
+        name = dir_index.get(normalize_name(topic_display))
+        if name is not None:
+            logger.debug("resolve_topic_dir: normalized match",
+                         root=str(root), topic=topic_display, resolved=name)
+            return root / name
     except Exception as e:
         logger.warning("resolve_topic_dir: scan failed", root=str(root), error=str(e))
 
@@ -61,10 +98,31 @@ def resolve_topic_dir(root: Path, topic_display: str) -> Path:
     return exact
 
 
-def find_topic_in_index(topic_display: str, index: Optional[dict]) -> Optional[str]:
+def _normalized_dir_index(root: str) -> dict[str, str]:
+    """{normalized name: real name} of the subdirectories of ``root``.
+
+    Built once per root and reused until the root's mtime changes, so repeated
+    resolutions do not normalize every entry again.
+    """
+    mtime_ns, names = subdir_listing(root)
+    cached = _norm_index_cache.get(root)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    mapping: dict[str, str] = {}
+    for name in names:
+        mapping.setdefault(normalize_name(name), name)
+    if len(_norm_index_cache) >= _NORM_INDEX_MAX:
+        _norm_index_cache.clear()
+    _norm_index_cache[root] = (mtime_ns, mapping)
+    return mapping
+
+
+def find_topic_in_index(topic_display: str, index: Optional[dict],
+                        key_map: Optional[dict[str, str]] = None) -> Optional[str]:
     """Find best-matching topic key in a cached index.
 
-    Tries exact match first, then normalized match.
+    Tries exact match first, then normalized match. ``key_map`` is the
+    topic_key_map() of ``index`` if the caller already holds it.
     """
     if not index or not isinstance(index, dict):
         return None
@@ -79,12 +137,33 @@ def find_topic_in_index(topic_display: str, index: Optional[dict]) -> Optional[s
         return topic_display
 
     # Normalized match
-    target = normalize_name(topic_display)
-    for key in topics.keys():
-        if normalize_name(key) == target:
-            logger.debug("find_topic_in_index: normalized match",
-                         topic=topic_display, matched_key=key)
-            return key
+    if key_map is None:
+        key_map = _topic_key_map(index)
+    key = key_map.get(normalize_name(topic_display))
+    if key is not None:
+        logger.debug("find_topic_in_index: normalized match",
+                     topic=topic_display, matched_key=key)
+        return key
 
     logger.debug("find_topic_in_index: no match", topic=topic_display)
     return None
+
+
+def topic_key_map(index: dict) -> dict[str, str]:
+    """{normalize_name(topic key): topic key} for ``index``; the first key wins on collisions."""
+    key_map: dict[str, str] = {}
+    for key in index.get('topics', {}) or {}:
+        key_map.setdefault(normalize_name(key), key)
+    return key_map
+
+
+def _topic_key_map(index: dict) -> dict[str, str]:
+    """topic_key_map(index), built once per index object."""
+    cached = _norm_key_index_cache.get(id(index))
+    if cached is not None and cached[0] is index:
+        return cached[1]
+    key_map = topic_key_map(index)
+    if len(_norm_key_index_cache) >= _NORM_KEY_CACHE_MAX:
+        _norm_key_index_cache.clear()
+    _norm_key_index_cache[id(index)] = (index, key_map)
+    return key_map
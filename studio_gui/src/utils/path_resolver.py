@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional, Mapping
 
-import structlog
+from ._lazy_log import LazyLogger
 
-logger = structlog.get_logger(__name__)
+logger = LazyLogger(__name__)
+
+# Imported once; stays None in headless environments without PySide6.
+try:
+    from PySide6.QtCore import QSettings as _QSETTINGS_CLS  # type: ignore
+except Exception:  # pragma: no cover - depends on the environment
+    _QSETTINGS_CLS = None
+
+_UNSET = object()
 
 
 class PathResolver:
@@ -22,25 +31,20 @@ class PathResolver:
     Returns pathlib.Path for consistency.
     """
 
-    MODULE_ENV_MAP: Mapping[str, str] = {
-        "outline": "OUTLINE_OUTPUT_ROOT",
-        "prompts": "PROMPTS_OUTPUT_ROOT",
-        "narration": "NARRATION_OUTPUT_ROOT",
-        "postprocess": "POSTPROC_OUTPUT_ROOT",
-        "final": "FINAL_OUTPUT_ROOT",
-        "tts": "TTS_OUTPUT_ROOT",
-        "export": "EXPORT_OUTPUT_ROOT",
+    # module -> (module-specific env var, subdir under NC_OUTPUTS_ROOT)
+    _MODULES: dict[str, tuple[str, str]] = {
+        "outline": ("OUTLINE_OUTPUT_ROOT", "outline"),
+        "prompts": ("PROMPTS_OUTPUT_ROOT", "prompts"),
+        "narration": ("NARRATION_OUTPUT_ROOT", "narration"),
+        "postprocess": ("POSTPROC_OUTPUT_ROOT", "postprocess"),
+        "final": ("FINAL_OUTPUT_ROOT", "final"),
+        "tts": ("TTS_OUTPUT_ROOT", "tts"),
+        "export": ("EXPORT_OUTPUT_ROOT", "export"),
     }
 
-    DEFAULT_SUBDIR: Mapping[str, str] = {
-        "outline": "outline",
-        "prompts": "prompts",
-        "narration": "narration",
-        "postprocess": "postprocess",
-        "final": "final",
-        "tts": "tts",
-        "export": "export",
-    }
+    # read-only views kept for callers of the previous attribute names
+    MODULE_ENV_MAP: Mapping[str, str] = {m: e for m, (e, _) in _MODULES.items()}
+    DEFAULT_SUBDIR: Mapping[str, str] = {m: d for m, (_, d) in _MODULES.items()}
 
     @classmethod
     def _env_or_none(cls, key: str) -> Optional[str]:
@@ -49,54 +53,97 @@ class PathResolver:
             logger.debug("PathResolver: using env var", var=key, value=v)
         return v
 
+    # memoized QSettings value (_UNSET until first read)
+    _qs_cached_value: object = _UNSET
+
     @classmethod
     def _qsettings_nc_outputs_root(cls) -> Optional[str]:
         """Try to read NC_OUTPUTS_ROOT from QSettings if available (only in GUI).
-        Import is local so this module can be used in headless tests.
+        The value is read once and memoized; see invalidate_qsettings().
         """
-        try:
-            from PySide6.QtCore import QSettings  # type: ignore
-
-            qs = QSettings()
-            value = qs.value("project/nc_outputs_root", type=str) or qs.value("NC_OUTPUTS_ROOT", type=str)
-            if isinstance(value, str) and value:
-                logger.debug("PathResolver: Using NC_OUTPUTS_ROOT from QSettings", value=value)
-                return value
-        except Exception:
-            return None
-        return None
+        if cls._qs_cached_value is not _UNSET:
+            return cls._qs_cached_value  # type: ignore[return-value]
+        value: Optional[str] = None
+        if _QSETTINGS_CLS is not None:
+            try:
+                qs = _QSETTINGS_CLS()
+                v = qs.value("project/nc_outputs_root", type=str) or qs.value("NC_OUTPUTS_ROOT", type=str)
+                if isinstance(v, str) and v:
+                    logger.debug("PathResolver: Using NC_OUTPUTS_ROOT from QSettings", value=v)
+                    value = v
+            except Exception:
+                value = None
+        cls._qs_cached_value = value
+        return value
+
+    @classmethod
+    def invalidate_qsettings(cls) -> None:
+        """Forget the memoized QSettings value (re-read on next use)."""
+        cls._qs_cached_value = _UNSET
 
     @classmethod
-    def get_root(cls, module: str) -> Path:
+    def get_root(cls, module: str, reset_cache: bool = False) -> Path:
+        """Resolved root for ``module``, memoized per (module, env values, cwd).
+
+        Env changes are picked up automatically; a QSettings change is not, so
+        pass ``reset_cache=True`` (or call clear_cache()) after updating it.
+        """
         module = module.lower()
-        if module not in cls.DEFAULT_SUBDIR:
+        entry = cls._MODULES.get(module)
+        if entry is None:
             raise ValueError(f"Unknown module for PathResolver: {module!r}")
+        if reset_cache:
+            cls.clear_cache()
+        return _get_root_cached(
+            cls,
+            module,
+            os.environ.get(entry[0]),
+            os.environ.get("NC_OUTPUTS_ROOT"),
+            os.getcwd(),
+        )
+
+    @classmethod
+    def get_all_roots(cls) -> dict[str, Path]:
+        """Roots of all known modules, keyed by module name.
+
+        Shares get_root's cache, so the QSettings read and NC_OUTPUTS_ROOT
+        resolution happen at most once for the whole batch.
+        """
+        return {module: cls.get_root(module) for module in cls._MODULES}
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all memoized roots and the memoized QSettings value."""
+        cls.invalidate_qsettings()
+        _get_root_cached.cache_clear()
+
+    @classmethod
+    def _calculate_root(cls, module: str) -> Path:
+        module_env, subdir = cls._MODULES[module]
 
         # 1) module-specific env var
-        module_env = cls.MODULE_ENV_MAP.get(module)
-        if module_env:
-            v = cls._env_or_none(module_env)
-            if v:
-                p = Path(v).expanduser().absolute()
-                logger.debug("PathResolver: resolved module-specific env path", module=module, path=str(p))
-                return p
+        v = cls._env_or_none(module_env)
+        if v:
+            p = Path(v).expanduser().absolute()
+            logger.debug("PathResolver: resolved module-specific env path", module=module, path=str(p))
+            return p
 
         # 2) NC_OUTPUTS_ROOT env
         nc = cls._env_or_none("NC_OUTPUTS_ROOT")
         if nc:
-            p = Path(nc).expanduser().absolute() / cls.DEFAULT_SUBDIR[module]
+            p = Path(nc).expanduser().absolute() / subdir
             logger.debug("PathResolver: resolved NC_OUTPUTS_ROOT + subdir", module=module, path=str(p))
             return p
 
         # 3) QSettings
         qs_nc = cls._qsettings_nc_outputs_root()
         if qs_nc:
-            p = Path(qs_nc).expanduser().absolute() / cls.DEFAULT_SUBDIR[module]
+            p = Path(qs_nc).expanduser().absolute() / subdir
             logger.debug("PathResolver: resolved QSettings NC_OUTPUTS_ROOT + subdir", module=module, path=str(p))
             return p
 
         # 4) fallback to ./outputs/<module>
-        p = Path.cwd() / "outputs" / cls.DEFAULT_SUBDIR[module]
+        p = Path.cwd() / "outputs" / subdir
         logger.debug("PathResolver: using fallback outputs path", module=module, path=str(p))
         return p
 
@@ -128,3 +175,11 @@ class PathResolver:
     @classmethod
     def export_root(cls) -> Path:
         return cls.get_root("export")
+
+
+@functools.lru_cache(maxsize=64)
+def _get_root_cached(
+    resolver: type[PathResolver], module: str, module_env: Optional[str], nc_env: Optional[str], cwd: str
+) -> Path:
+    # the env values and cwd are only part of the key; _calculate_root reads them itself
+    return resolver._calculate_root(module)
@@ -1,11 +1,27 @@
 """Log pane widget for displaying subprocess output."""
 from __future__ import annotations
 
+import threading
+
+from PySide6.QtCore import QTimer, Signal
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTextEdit
 
 
 class LogPane(QWidget):
-    """Text widget for displaying subprocess stdout/stderr."""
+    """Text widget for displaying subprocess stdout/stderr.
+
+    Lines are buffered and written to the view in one insert every
+    FLUSH_INTERVAL_MS, so a flood of subprocess output costs one relayout per
+    flush instead of one per line. append/append_lines may be called from
+    worker threads; the flush itself always runs on the GUI thread.
+    """
+
+    FLUSH_INTERVAL_MS = 50
+
+    # emitted when the buffer goes from empty to non-empty; queued to the GUI
+    # thread when the append comes from a worker thread
+    _flush_requested = Signal()
 
     def __init__(self) -> None:
         super().__init__()
@@ -14,8 +30,17 @@ class LogPane(QWidget):
 
         self.view = QTextEdit(self)
         self.view.setReadOnly(True)
+        self.view.setUndoRedoEnabled(False)
         layout.addWidget(self.view)
 
+        self._pending: list[str] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+        self._flush_requested.connect(self._schedule_flush)
+
     def append(self, stream: str, text: str) -> None:
         """Append a line to the log with stream prefix.
 
@@ -24,8 +49,47 @@ class LogPane(QWidget):
             text: Line of text to append
         """
         prefix = "[OUT]" if stream == "stdout" else "[ERR]"
-        self.view.append(f"{prefix} {text}")
+        self._queue([f"{prefix} {text}"])
+
+    def append_lines(self, stream: str, lines: list[str]) -> None:
+        """Append several lines with stream prefix."""
+        prefix = "[OUT]" if stream == "stdout" else "[ERR]"
+        self._queue([f"{prefix} {text}" for text in lines])
 
     def clear(self) -> None:
         """Clear all log content."""
+        self._flush_timer.stop()
+        with self._pending_lock:
+            self._pending.clear()
         self.view.clear()
+
+    def _queue(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        with self._pending_lock:
+            was_empty = not self._pending
+            self._pending.extend(lines)
+        if was_empty:
+            self._flush_requested.emit()
+
+    def _schedule_flush(self) -> None:
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self) -> None:
+        """Write buffered lines as plain text at the end of the document."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        text = "\n".join(pending)
+        doc = self.view.document()
+        if not doc.isEmpty():
+            text = "\n" + text
+        bar = self.view.verticalScrollBar()
+        follow = bar.value() == bar.maximum()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+        if follow:
+            bar.setValue(bar.maximum())
@@ -1,20 +1,24 @@
 from pathlib import Path
+import mmap
 import re
+PREVIEW_DEF = re.compile(rb"def preview_selected\b")
 p = Path('studio_gui/src/main.py')
 if not p.exists():
     print('main.py not found at', p)
+elif p.stat().st_size == 0:
+    # mmap cannot map an empty file
+    print('main.py is empty:', p.resolve())
 else:
-    txt = p.read_text(encoding='utf-8')
     print('main.py path:', p.resolve())
-    found = 'def preview_selected' in txt
-    print('contains "def preview_selected":', found)
-    if found:
-        # print snippet around definition
-        m = re.search(r"def preview_selected\s*\(.*?\):", txt)
+    # search the raw bytes in place; only the snippet gets decoded
+    with open(p, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        m = PREVIEW_DEF.search(mm)
+        print('contains "def preview_selected":', m is not None)
         if m:
+            # print snippet around definition
             start = m.start()
-            snippet = txt[start:start+400]
+            snippet = mm[start:start+400].decode('utf-8', errors='replace')
             print('\n--- snippet ---')
             print(snippet)
-    # Also show whether PostProcessTab class exists
-    print('contains class PostProcessTab:', 'class PostProcessTab' in txt)
+        # Also show whether PostProcessTab class exists
+        print('contains class PostProcessTab:', mm.find(b'class PostProcessTab') != -1)
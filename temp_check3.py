@@ -19,13 +19,16 @@ print('\nstudio_gui modules found via pkgutil (first 20):', len(matches))
 from pathlib import Path
 roots = [Path(p) for p in sys.path if p]
 candidates = []
-for r in roots:
+for r in dict.fromkeys(roots):
+    # only descend into top-level studio_gui* dirs instead of walking the whole path entry;
+    # an entry that already sits inside studio_gui (e.g. .../studio_gui/src) is searched as is
+    pattern = '**/main.py' if any(part.startswith('studio_gui') for part in r.parts) else 'studio_gui*/**/main.py'
     try:
-        for path in r.rglob('main.py'):
-            if 'studio_gui' in str(path):
-                candidates.append(str(path))
+        for path in r.glob(pattern):
+            candidates.append(str(path.resolve()))
     except Exception:
         pass
+candidates = list(dict.fromkeys(candidates))
 print('\nFound candidate main.py files (filtered by name containing "studio_gui"):', len(candidates))
 for c in candidates[:20]:
     print(' -', c)
@@ -11,12 +11,18 @@ from __future__ import annotations
 import sys
 import os
 import subprocess
+import threading
 import json
 from pathlib import Path
 from typing import Optional
 import argparse
 from datetime import datetime
 
+try:  # optional, faster validation of large logs
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
 # Colors for terminal output
 class Colors:
     GREEN = '\033[92m'
@@ -26,34 +32,67 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# colored "[LEVEL] " prefix per level, built once
+_LOG_PREFIX = {
+    level: f"{color}[{level}] "
+    for level, color in (("INFO", Colors.BLUE), ("SUCCESS", Colors.GREEN),
+                         ("ERROR", Colors.RED), ("WARN", Colors.YELLOW))
+}
+
 def log(msg: str, level: str = "INFO"):
-    colors = {"INFO": Colors.BLUE, "SUCCESS": Colors.GREEN, "ERROR": Colors.RED, "WARN": Colors.YELLOW}
-    color = colors.get(level, "")
-    print(f"{color}[{level}] {msg}{Colors.END}")
+    prefix = _LOG_PREFIX.get(level) or f"[{level}] "
+    sys.stdout.write(prefix + msg + Colors.END + "\n")
+
+def _pump(pipe, sink: list[str]) -> None:
+    """Echo a child's output line by line as it arrives, keeping a copy."""
+    for line in pipe:
+        sink.append(line)
+        print(f"    {line}", end="", flush=True)
+    pipe.close()
 
 def run_command(cmd: list[str], cwd: Optional[str] = None, check: bool = True) -> tuple[int, str, str]:
-    """Run command and return (exit_code, stdout, stderr)"""
+    """Run command, streaming its output, and return (exit_code, stdout, stderr)"""
     log(f"Running: {' '.join(cmd)}", "INFO")
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
             cwd=cwd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
             encoding='utf-8',
-            errors='replace'
+            errors='replace',
+            bufsize=1,
         )
-        if check and result.returncode != 0:
-            log(f"Command failed with exit code {result.returncode}", "ERROR")
-            log(f"STDOUT: {result.stdout}", "ERROR")
-            log(f"STDERR: {result.stderr}", "ERROR")
-        return result.returncode, result.stdout, result.stderr
+        out: list[str] = []
+        err: list[str] = []
+        readers = [threading.Thread(target=_pump, args=(proc.stdout, out), daemon=True),
+                   threading.Thread(target=_pump, args=(proc.stderr, err), daemon=True)]
+        for t in readers:
+            t.start()
+        returncode = proc.wait()
+        for t in readers:
+            t.join()
+        if check and returncode != 0:
+            # output was already echoed while streaming
+            log(f"Command failed with exit code {returncode}", "ERROR")
+        return returncode, "".join(out), "".join(err)
     except Exception as e:
         log(f"Exception running command: {e}", "ERROR")
         return 1, "", str(e)
 
-def check_file_exists(path: Path, description: str) -> bool:
-    if path.exists():
+def _scan_dir(parent: Path) -> dict[str, os.DirEntry]:
+    """One listing of ``parent`` (name -> DirEntry); empty if it can't be read."""
+    try:
+        with os.scandir(parent) as it:
+            return {e.name: e for e in it}
+    except OSError:
+        return {}
+
+def check_file_exists(path: Path, description: str, entries: Optional[dict[str, os.DirEntry]] = None) -> bool:
+    """``entries`` is an already scanned listing of path.parent, to avoid a stat."""
+    found = path.name in entries if entries is not None else path.exists()
+    if found:
         log(f"[OK] Found: {description} ({path})", "SUCCESS")
         return True
     else:
@@ -62,8 +101,12 @@ def check_file_exists(path: Path, description: str) -> bool:
 
 def check_json_valid(path: Path, description: str) -> bool:
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if orjson is not None:
+            orjson.loads(raw)
+        else:
+            json.loads(raw.decode('utf-8'))
         log(f"[OK] Valid JSON: {description}", "SUCCESS")
         return True
     except Exception as e:
@@ -92,7 +135,11 @@ def main():
     outputs_root = repo_root / "outputs"
 
     # Set environment for unified outputs
+    # (still needed by the steps that have no root option: narration, final)
     os.environ["NC_OUTPUTS_ROOT"] = str(outputs_root)
+    # per-module roots, passed explicitly where a step accepts them
+    outline_root = outputs_root / "outline"
+    prompts_root = outputs_root / "prompts"
 
     results = {
         "topic": topic,
@@ -123,7 +170,7 @@ def main():
             "-l", lang,
             "-c", str(outline_config),
             "-t", str(outline_template),
-            "-o", str(outputs_root / "outline"),
+            "-o", str(outline_root),
             "-v"
         ]
 
@@ -141,7 +188,7 @@ def main():
         results["steps"]["outline"] = {"skipped": True}
 
     # Check outline outputs
-    outline_dir = outputs_root / "outline" / topic / lang
+    outline_dir = outline_root / topic / lang
     osnova_file = outline_dir / "osnova.json"
 
     if not check_file_exists(osnova_file, "osnova.json"):
@@ -165,6 +212,8 @@ def main():
             str(prompts_script),
             "--topic", topic,
             "--language", lang,
+            "--outline-root", str(outline_root),
+            "--prompts-root", str(prompts_root),
             "-y",  # auto-overwrite
             "-v"
         ]
@@ -182,7 +231,7 @@ def main():
         results["steps"]["prompts"] = {"skipped": True}
 
     # Check prompts outputs
-    prompts_dir = outputs_root / "prompts" / topic / lang / f"ep{episode_id}"
+    prompts_dir = prompts_root / topic / lang / f"ep{episode_id}"
     prompts_folder = prompts_dir / "prompts"
     meta_folder = prompts_dir / "meta"
     episode_context = meta_folder / "episode_context.json"
@@ -194,7 +243,8 @@ def main():
     if check_file_exists(episode_context, "episode_context.json"):
         check_json_valid(episode_context, "episode_context.json")
         # Count prompts
-        prompt_files = list(prompts_folder.glob("msp_*_execution.txt"))
+        prompt_files = [n for n in _scan_dir(prompts_folder)
+                        if n.startswith("msp_") and n.endswith("_execution.txt")]
         log(f"Found {len(prompt_files)} execution prompts", "INFO")
 
     # ============================================
@@ -237,13 +287,15 @@ def main():
     narration_dir = outputs_root / "narration" / topic / lang / f"ep{episode_id}"
 
     if check_file_exists(narration_dir, "narration directory"):
-        segment_files = list(narration_dir.glob("segment_*.txt"))
+        narration_entries = _scan_dir(narration_dir)
+        segment_files = [n for n in narration_entries
+                         if n.startswith("segment_") and n.endswith(".txt")]
         log(f"Found {len(segment_files)} segment files", "INFO")
         results["steps"]["narration"]["segment_count"] = len(segment_files)
 
         # Check generation log
         gen_log = narration_dir / "generation_log.json"
-        if check_file_exists(gen_log, "generation_log.json"):
+        if check_file_exists(gen_log, "generation_log.json", narration_entries):
             check_json_valid(gen_log, "generation_log.json")
 
     # ============================================
@@ -286,22 +338,24 @@ def main():
     final_dir = outputs_root / "final" / topic / lang / f"episode_{episode_id}"
     final_file = final_dir / f"episode_{episode_id}_final.txt"
     final_metrics = final_dir / "metrics.json"
+    final_entries = _scan_dir(final_dir)
 
-    if check_file_exists(final_file, "final narrative"):
+    if check_file_exists(final_file, "final narrative", final_entries):
         # Check size
-        size = final_file.stat().st_size
+        size = final_entries[final_file.name].stat().st_size
         log(f"Final file size: {size} bytes", "INFO")
 
         # Count words
         try:
-            text = final_file.read_text(encoding='utf-8')
-            word_count = len(text.split())
+            # count per line so the whole narrative is never held in memory
+            with open(final_file, 'r', encoding='utf-8') as f:
+                word_count = sum(len(line.split()) for line in f)
             log(f"Final word count: {word_count} words", "INFO")
             results["steps"]["final"]["word_count"] = word_count
         except Exception as e:
             log(f"Error reading final file: {e}", "ERROR")
 
-    if check_file_exists(final_metrics, "metrics.json"):
+    if check_file_exists(final_metrics, "metrics.json", final_entries):
         check_json_valid(final_metrics, "metrics.json")
 
     # ============================================
@@ -0,0 +1,50 @@
+"""Tests for the asyncio ProcessRunner line streaming."""
+import asyncio
+import sys
+
+from studio_gui.src.process_runner import ProcessRunner
+
+CHILD = r"""
+import sys
+for i in range(5000):
+    sys.stdout.write(f"out {i}\n")
+sys.stdout.write("x" * 100000 + "\n")
+sys.stderr.write("err 1\r\nerr 2\n")
+sys.stdout.write("tail without newline")
+"""
+
+
+def _collect(script, timeout=30):
+    async def run():
+        runner = ProcessRunner([sys.executable, "-c", script])
+        await runner.start()
+        events = [evt async for evt in runner.iter_lines()]
+        return await runner.wait(), events
+
+    # iter_lines must finish on its own once both streams hit EOF
+    return asyncio.run(asyncio.wait_for(run(), timeout))
+
+
+def test_iter_lines_delivers_every_line():
+    code, events = _collect(CHILD)
+    assert code == 0
+
+    out = [e.line for e in events if e.stream == "stdout"]
+    err = [e.line for e in events if e.stream == "stderr"]
+    assert out[:5000] == [f"out {i}" for i in range(5000)]
+    assert out[5000] == "x" * 100000
+    assert out[5001:] == ["tail without newline"]
+    assert err == ["err 1", "err 2"]
+
+
+def test_iter_lines_stops_at_eof_without_output():
+    code, events = _collect("pass")
+    assert code == 0
+    assert events == []
+
+
+def test_run_collect_returns_exit_code_and_events():
+    runner = ProcessRunner([sys.executable, "-c", "import sys; print('a'); sys.exit(3)"])
+    code, events = asyncio.run(runner.run_collect(timeout=30))
+    assert code == 3
+    assert [(e.stream, e.line) for e in events] == [("stdout", "a")]
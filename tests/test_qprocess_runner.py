@@ -0,0 +1,32 @@
+"""Table tests for SubprocessController._split_complete."""
+import pytest
+
+pytest.importorskip("PySide6")
+
+from studio_gui.src.qprocess_runner import SubprocessController
+
+
+def _feed(chunks):
+    lines, buf = [], ""
+    for chunk in chunks:
+        got, buf = SubprocessController._split_complete(buf, chunk)
+        lines.extend(got)
+    return lines, buf
+
+
+@pytest.mark.parametrize("chunks, lines, buf", [
+    (["a\nb\n"], ["a", "b"], ""),
+    (["no newline"], [], "no newline"),
+    (["par", "tial"], [], "partial"),
+    (["par", "tial\nnext"], ["partial"], "next"),
+    (["x\r\n"], ["x"], ""),
+    (["x\r", "\ny\n"], ["x", "y"], ""),
+    (["x\r", "\n"], ["x"], ""),
+    (["10%\r20%\r"], ["10%", "20%"], "\r"),
+    (["10%\r", "20%"], ["10%"], "20%"),
+    (["10%\r", "20%\r", "done\n"], ["10%", "20%", "done"], ""),
+    (["a\n\nb\n"], ["a", "", "b"], ""),
+    (["a\r\n", "\r\n"], ["a", ""], ""),
+])
+def test_split_complete(chunks, lines, buf):
+    assert _feed(chunks) == (lines, buf)
@@ -0,0 +1,82 @@
+"""Headless tests for the GUI settings cache and its writer thread."""
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QCoreApplication, QMetaObject, QSettings, Qt, QThread
+
+from studio_gui.src.main import CachedSettings, SettingsWriter, _changed_values
+
+
+@pytest.fixture
+def ini_settings(tmp_path):
+    """QSettings() resolves to an INI file under tmp_path for the test's duration."""
+    app = QCoreApplication.instance() or QCoreApplication([])
+    QCoreApplication.setOrganizationName("NightChroniclesTest")
+    QCoreApplication.setApplicationName("SettingsTest")
+    QSettings.setDefaultFormat(QSettings.IniFormat)
+    QSettings.setPath(QSettings.IniFormat, QSettings.UserScope, str(tmp_path))
+    yield app
+    QSettings.setDefaultFormat(QSettings.NativeFormat)
+
+
+@pytest.fixture
+def writer_thread(ini_settings):
+    thread = QThread()
+    writer = SettingsWriter()
+    writer.moveToThread(thread)
+    thread.start()
+    payloads = []
+    writer.write_requested.connect(payloads.append, Qt.DirectConnection)
+    yield writer, payloads
+    thread.quit()
+    thread.wait()
+
+
+def _flush(writer):
+    # queued behind the pending writes, like _shutdown_settings
+    QMetaObject.invokeMethod(writer, "flush", Qt.BlockingQueuedConnection)
+
+
+def test_cached_settings_persist_through_writer(writer_thread):
+    writer, _ = writer_thread
+    s = CachedSettings(QSettings(), writer)
+    s.beginGroup("outline")
+    s.update({"topic": "Řím", "episodes": 6, "consensus": True})
+    s.endGroup()
+    assert s.value("outline/topic") == "Řím"
+    _flush(writer)
+
+    reloaded = CachedSettings(QSettings())
+    assert reloaded.value("outline/topic") == "Řím"
+    assert int(reloaded.value("outline/episodes")) == 6
+    assert reloaded.value("outline/consensus") in (True, "true")
+
+
+def test_only_changed_keys_are_written(writer_thread):
+    writer, payloads = writer_thread
+    values = [("topic", "Řím"), ("episodes", 6), ("consensus", True), ("temp", 0.7)]
+    s = CachedSettings(QSettings(), writer)
+    s.beginGroup("outline")
+    s.update(_changed_values(s, values))
+    s.endGroup()
+    _flush(writer)
+
+    # a fresh process reads everything back as text from the INI file
+    reloaded = CachedSettings(QSettings(), writer)
+    reloaded.beginGroup("outline")
+    assert _changed_values(reloaded, values) == {}
+    changed = _changed_values(reloaded, [("topic", "Kartágo"), ("episodes", 6), ("consensus", False)])
+    assert changed == {"topic": "Kartágo", "consensus": False}
+    reloaded.update(changed)
+    reloaded.endGroup()
+    _flush(writer)
+
+    assert payloads[-1] == {"outline/topic": "Kartágo", "outline/consensus": False}
+    assert QSettings().value("outline/topic") == "Kartágo"
+
+
+def test_changed_values_does_not_mistake_text_for_bool(ini_settings):
+    s = CachedSettings(QSettings())
+    s.update({"flag": "True"})
+    assert _changed_values(s, [("flag", True)]) == {"flag": True}
@@ -0,0 +1,69 @@
+"""Tests for dir_cache utilities."""
+import pytest
+
+from studio_gui.src.utils import dir_cache
+from studio_gui.src.utils.dir_cache import list_subdirs, clear_dir_cache
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    clear_dir_cache()
+    yield
+    clear_dir_cache()
+
+
+def test_list_subdirs_only_directories(tmp_path):
+    (tmp_path / "ep01").mkdir()
+    (tmp_path / "ep02").mkdir()
+    (tmp_path / "notes.txt").write_text("x")
+
+    assert sorted(list_subdirs(str(tmp_path))) == ["ep01", "ep02"]
+
+
+def test_list_subdirs_sees_new_folder_by_default(tmp_path):
+    (tmp_path / "ep01").mkdir()
+    assert list_subdirs(str(tmp_path)) == ["ep01"]
+
+    (tmp_path / "ep02").mkdir()
+    assert sorted(list_subdirs(str(tmp_path))) == ["ep01", "ep02"]
+
+
+def test_list_subdirs_reuses_listing_while_mtime_unchanged(tmp_path, monkeypatch):
+    (tmp_path / "ep01").mkdir()
+    assert list_subdirs(str(tmp_path)) == ["ep01"]
+
+    def no_scandir(path):
+        raise AssertionError("listing should come from the cache")
+
+    monkeypatch.setattr(dir_cache.os, "scandir", no_scandir)
+    assert list_subdirs(str(tmp_path)) == ["ep01"]
+
+
+def test_list_subdirs_ttl_opts_into_stale_listing(tmp_path):
+    (tmp_path / "ep01").mkdir()
+    assert list_subdirs(str(tmp_path), ttl=60) == ["ep01"]
+
+    (tmp_path / "ep02").mkdir()
+    assert list_subdirs(str(tmp_path), ttl=60) == ["ep01"]
+
+
+def test_clear_dir_cache_forces_rescan(tmp_path):
+    (tmp_path / "ep01").mkdir()
+    list_subdirs(str(tmp_path))
+    (tmp_path / "ep02").mkdir()
+
+    clear_dir_cache()
+    assert sorted(list_subdirs(str(tmp_path))) == ["ep01", "ep02"]
+
+
+def test_list_subdirs_returns_copy(tmp_path):
+    (tmp_path / "ep01").mkdir()
+    list_subdirs(str(tmp_path)).append("bogus")
+
+    assert list_subdirs(str(tmp_path)) == ["ep01"]
+    assert len(dir_cache._cache) == 1
+
+
+def test_list_subdirs_missing_path_raises(tmp_path):
+    with pytest.raises(OSError):
+        list_subdirs(str(tmp_path / "missing"))
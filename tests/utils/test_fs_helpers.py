@@ -6,6 +6,7 @@ from studio_gui.src.utils.fs_helpers import (
     normalize_name,
     resolve_topic_dir,
     find_topic_in_index,
+    topic_key_map,
 )
 
 
@@ -24,6 +25,12 @@ def test_normalize_name_special_chars():
     assert normalize_name("test___multiple") == "test_multiple"
 
 
+def test_normalize_name_outside_diacritic_table():
+    # letters the translate table doesn't cover still go through NFKD
+    assert normalize_name("Čáslav ﬁnále") == "caslav_finale"
+    assert normalize_name("Łódź") == "odz"
+
+
 def test_resolve_topic_dir_exact_match(tmp_path):
     topic_dir = tmp_path / "Ancient_Rome"
     topic_dir.mkdir()
@@ -76,3 +83,49 @@ def test_find_topic_in_index_invalid_input():
     assert find_topic_in_index("test", None) is None
     assert find_topic_in_index("test", {}) is None
     assert find_topic_in_index("test", {"topics": {}}) is None
+
+
+def test_resolve_topic_dir_sees_new_folder_after_change(tmp_path):
+    (tmp_path / "Other").mkdir()
+    assert resolve_topic_dir(tmp_path, "Staroveky Rim") == tmp_path / "Staroveky Rim"
+
+    topic_dir = tmp_path / "Starověký_Řím"
+    topic_dir.mkdir()
+    assert resolve_topic_dir(tmp_path, "Staroveky Rim") == topic_dir
+
+
+def test_find_topic_in_index_sees_replaced_index():
+    index = {"topics": {"Test": {}}}
+    assert find_topic_in_index("Staroveky Rim", index) is None
+
+    # indexes are replaced, not edited in place
+    index = {"topics": {"Test": {}, "Starověký_Řím": {}}}
+    assert find_topic_in_index("Staroveky Rim", index) == "Starověký_Řím"
+
+    index = {"topics": {"Staroveky-Rim": {}}}
+    assert find_topic_in_index("Staroveky Rim", index) == "Staroveky-Rim"
+
+
+def test_find_topic_in_index_uses_given_key_map():
+    index = {"topics": {"Starověký_Řím": {}, "Staroveky-Rim": {}}}
+    key_map = topic_key_map(index)
+    assert key_map == {"staroveky_rim": "Starověký_Řím"}
+    assert find_topic_in_index("Staroveky Rim", index, key_map) == "Starověký_Řím"
+
+
+def test_resolve_topic_dir_stats_root_once(tmp_path, monkeypatch):
+    from studio_gui.src.utils import dir_cache
+
+    (tmp_path / "Starověký_Řím").mkdir()
+    root = str(tmp_path)
+    real_stat = dir_cache.os.stat
+    calls = []
+
+    def counting_stat(path, *args, **kwargs):
+        if str(path) == root:
+            calls.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(dir_cache.os, "stat", counting_stat)
+    assert resolve_topic_dir(tmp_path, "Staroveky Rim") == tmp_path / "Starověký_Řím"
+    assert len(calls) == 1
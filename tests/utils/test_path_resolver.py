@@ -59,3 +59,28 @@ def test_invalid_module_raises():
     """Invalid module name should raise ValueError."""
     with pytest.raises(ValueError, match="Unknown module"):
         PathResolver.get_root("invalid_module")
+
+
+def test_cached_root_follows_env_changes(monkeypatch, tmp_path):
+    """Memoized roots must not go stale when the env var changes."""
+    monkeypatch.delenv("PROMPTS_OUTPUT_ROOT", raising=False)
+    monkeypatch.setenv("NC_OUTPUTS_ROOT", str(tmp_path / "a"))
+    assert PathResolver.prompts_root() == tmp_path / "a" / "prompts"
+    assert PathResolver.prompts_root() is PathResolver.prompts_root()
+
+    monkeypatch.setenv("NC_OUTPUTS_ROOT", str(tmp_path / "b"))
+    assert PathResolver.prompts_root() == tmp_path / "b" / "prompts"
+    assert PathResolver.get_root("prompts", reset_cache=True) == tmp_path / "b" / "prompts"
+
+
+def test_get_all_roots_matches_get_root(monkeypatch, tmp_path):
+    """get_all_roots should agree with the per-module lookups, overrides included."""
+    monkeypatch.setenv("NC_OUTPUTS_ROOT", str(tmp_path))
+    monkeypatch.setenv("FINAL_OUTPUT_ROOT", str(tmp_path / "elsewhere"))
+    for key in ("OUTLINE_OUTPUT_ROOT", "PROMPTS_OUTPUT_ROOT", "NARRATION_OUTPUT_ROOT"):
+        monkeypatch.delenv(key, raising=False)
+
+    roots = PathResolver.get_all_roots()
+    assert roots["final"] == tmp_path / "elsewhere"
+    assert roots["prompts"] == tmp_path / "prompts"
+    assert roots == {m: PathResolver.get_root(m) for m in roots}